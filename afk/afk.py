@@ -22,11 +22,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import contextlib
+from collections import deque
 from datetime import datetime, timezone
+from typing import Any
 
 import discord
 from dcv2nav import LayoutViewPaginator
+from discord.ext import tasks
 from red_commons.logging import getLogger
 from redbot.core import Config, commands
 from redbot.core.bot import Red
@@ -35,6 +39,8 @@ from redbot.core.bot import Red
 log = getLogger("red.maxapp.afk")
 
 PINGS_PER_PAGE = 10
+MAX_PINGS = 100
+PING_FLUSH_INTERVAL = 5
 
 
 class AFK(commands.Cog):
@@ -66,6 +72,57 @@ class AFK(commands.Cog):
 
         self.config.register_guild(**default_guild)
         self.config.register_member(**default_member)
+        # (guild_id, member_id) -> cached member data, only for members currently AFK.
+        self._afk_cache: dict[tuple[int, int], dict[str, Any]] = {}
+        # (guild_id, member_id) -> pings not yet cleared by `afkset list`.
+        # Written to Config in batches by `flush_pings` instead of on every mention.
+        self._ping_buffers: dict[tuple[int, int], deque[dict]] = {}
+        self._dirty_pings: set[tuple[int, int]] = set()
+
+    async def cog_load(self) -> None:
+        all_members = await self.config.all_members()
+        for guild_id, members in all_members.items():
+            for member_id, data in members.items():
+                if data.get("afk"):
+                    self._afk_cache[(guild_id, member_id)] = dict(data)
+                if data.get("pings"):
+                    self._ping_buffers[(guild_id, member_id)] = deque(
+                        data["pings"], maxlen=MAX_PINGS
+                    )
+        log.debug("AFK cache initialised with %d AFK members.", len(self._afk_cache))
+        self.flush_pings.start()
+
+    async def cog_unload(self) -> None:
+        self.flush_pings.cancel()
+        await self._flush_pings()
+
+    async def _flush_pings(self) -> None:
+        """Write every buffered ping list that changed since the last flush to Config."""
+        # Keys leave the dirty set one at a time, so a flush cancelled part way (e.g. by
+        # cog_unload) leaves the rest for the final flush.
+        for key in list(self._dirty_pings):
+            self._dirty_pings.discard(key)
+            buffer = self._ping_buffers.get(key)
+            if buffer is None:
+                continue
+            try:
+                await self.config.member_from_ids(*key).pings.set(list(buffer))
+            except asyncio.CancelledError:
+                self._dirty_pings.add(key)
+                raise
+            except Exception:
+                self._dirty_pings.add(key)
+                log.exception(
+                    "Failed to flush AFK pings for member %s in guild %s", key[1], key[0]
+                )
+
+    @tasks.loop(seconds=PING_FLUSH_INTERVAL)
+    async def flush_pings(self) -> None:
+        await self._flush_pings()
+
+    def _clear_ping_buffer(self, key: tuple[int, int]) -> None:
+        self._ping_buffers.pop(key, None)
+        self._dirty_pings.discard(key)
 
     def format_help_for_context(self, ctx: commands.Context) -> str:
         """Thanks Sinbad!"""
@@ -76,39 +133,46 @@ class AFK(commands.Cog):
         """Handle data deletion requests."""
         all_members = await self.config.all_members()
         for guild_id in all_members:
+            self._afk_cache.pop((guild_id, user_id), None)
+            self._clear_ping_buffer((guild_id, user_id))
             await self.config.member_from_ids(guild_id, user_id).clear()
 
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat()
 
+    def _can_edit_nickname(self, member: discord.Member) -> bool:
+        return (
+            member.guild.me.guild_permissions.manage_nicknames
+            and member.guild.owner_id != member.id
+            and member.guild.me.top_role > member.top_role
+        )
+
     async def _set_afk(self, member: discord.Member, message: str) -> None:
-        await self.config.member(member).afk.set(True)
-        await self.config.member(member).message.set(message)
-        await self.config.member(member).timestamp.set(self._now_iso())
-        await self.config.member(member).pings.set([])
-        role_id = await self.config.guild(member.guild).afk_role()
-        if role_id:
-            role = member.guild.get_role(role_id)
-            if role:
+        key = (member.guild.id, member.id)
+        self._clear_ping_buffer(key)
+        async with self.config.member(member).all() as data:
+            data.update(afk=True, message=message, timestamp=self._now_iso(), pings=[])
+            self._afk_cache[key] = dict(data)
+
+        # Roles go through add_roles so changes made meanwhile by others are kept,
+        # and a failed nickname edit cannot cost the member their AFK role.
+        guild_data = await self.config.guild(member.guild).all()
+        if guild_data["afk_role"]:
+            role = member.guild.get_role(guild_data["afk_role"])
+            if role and role not in member.roles:
                 with contextlib.suppress(discord.HTTPException):
                     await member.add_roles(role, reason="AFK status set")
 
-        nickname_afk = await self.config.guild(member.guild).nickname_afk()
-        if (
-            nickname_afk
-            and member.guild.me.guild_permissions.manage_nicknames
-            and member.guild.owner_id != member.id
-            and member.guild.me.top_role > member.top_role
-        ):
+        if guild_data["nickname_afk"] and self._can_edit_nickname(member):
             current = member.display_name
             if not current.startswith("[AFK] "):
                 with contextlib.suppress(discord.HTTPException):
                     await member.edit(nick=f"[AFK] {current[:26]}", reason="AFK status set")
 
     async def _remove_afk(self, member: discord.Member) -> None:
-        await self.config.member(member).afk.set(False)
-        await self.config.member(member).message.set("")
-        await self.config.member(member).timestamp.set(None)
+        self._afk_cache.pop((member.guild.id, member.id), None)
+        async with self.config.member(member).all() as data:
+            data.update(afk=False, message="", timestamp=None)
 
         role_id = await self.config.guild(member.guild).afk_role()
         if role_id:
@@ -117,11 +181,7 @@ class AFK(commands.Cog):
                 with contextlib.suppress(discord.HTTPException):
                     await member.remove_roles(role, reason="AFK status removed")
 
-        if (
-            member.guild.me.guild_permissions.manage_nicknames
-            and member.guild.owner_id != member.id
-            and member.guild.me.top_role > member.top_role
-        ):
+        if self._can_edit_nickname(member):
             current = member.display_name
             if current.startswith("[AFK] "):
                 new_nick = current[6:].strip() or None
@@ -169,8 +229,11 @@ class AFK(commands.Cog):
             return
         if not isinstance(message.author, discord.Member):
             return
-        author_data = await self.config.member(message.author).all()
-        if author_data["afk"] and author_data["autoremove"]:
+        if not self._afk_cache:
+            return
+        guild_id = message.guild.id
+        author_data = self._afk_cache.get((guild_id, message.author.id))
+        if author_data is not None and author_data["autoremove"]:
             ctx = await self.bot.get_context(message)
             if ctx.valid:
                 return
@@ -198,8 +261,8 @@ class AFK(commands.Cog):
             if not isinstance(mention, discord.Member):
                 continue
 
-            mention_data = await self.config.member(mention).all()
-            if not mention_data["afk"]:
+            mention_data = self._afk_cache.get((guild_id, mention.id))
+            if mention_data is None:
                 continue
             afk_message = mention_data["message"] or "No message set."
             ts_str = mention_data.get("timestamp")
@@ -211,7 +274,7 @@ class AFK(commands.Cog):
                 except ValueError:
                     pass
 
-            delete_after = await self.config.member(mention).delete_after()
+            delete_after = mention_data["delete_after"]
             text = (
                 f"**{discord.utils.escape_markdown(mention.display_name)}** is currently AFK{discord_ts}.\n"
                 f"> {discord.utils.escape_markdown(afk_message)}"
@@ -228,11 +291,11 @@ class AFK(commands.Cog):
                 "content": content_preview[:200],
                 "timestamp": self._now_iso(),
             }
-            async with self.config.member(mention).pings() as pings:
-                pings.append(ping_entry)
-                # Cap at 100 pings to avoid unbounded growth
-                if len(pings) > 100:
-                    pings[:] = pings[-100:]
+            key = (guild_id, mention.id)
+            # The deque caps pings at MAX_PINGS to avoid unbounded growth
+            buffer = self._ping_buffers.setdefault(key, deque(maxlen=MAX_PINGS))
+            buffer.append(ping_entry)
+            self._dirty_pings.add(key)
 
     @commands.command()
     @commands.guild_only()
@@ -286,6 +349,8 @@ class AFK(commands.Cog):
             )
 
         await self.config.member(ctx.author).delete_after.set(seconds)
+        if cached := self._afk_cache.get((ctx.guild.id, ctx.author.id)):
+            cached["delete_after"] = seconds
         if seconds is None:
             text = (
                 "## ⏱️ AFK Notification Duration\nAFK notifications will now persist indefinitely."
@@ -303,7 +368,11 @@ class AFK(commands.Cog):
 
         The list is cleared after viewing it.
         """
-        pings = await self.config.member(ctx.author).pings()
+        key = (ctx.guild.id, ctx.author.id)
+        buffer = self._ping_buffers.get(key)
+        pings = (
+            list(buffer) if buffer is not None else await self.config.member(ctx.author).pings()
+        )
 
         if not pings:
             view = discord.ui.LayoutView()
@@ -315,6 +384,7 @@ class AFK(commands.Cog):
             return await ctx.send(view=view)
 
         pages = self._build_ping_pages(pings)
+        self._clear_ping_buffer(key)
         await self.config.member(ctx.author).pings.set([])
         if len(pages) == 1:
             view = discord.ui.LayoutView()
@@ -334,6 +404,8 @@ class AFK(commands.Cog):
         current = await self.config.member(ctx.author).autoremove()
         new = not current
         await self.config.member(ctx.author).autoremove.set(new)
+        if cached := self._afk_cache.get((ctx.guild.id, ctx.author.id)):
+            cached["autoremove"] = new
 
         state = "**enabled** ✅" if new else "**disabled** ❌"
         text = f"## ⚙️ Auto-Remove AFK\nAuto-remove is now {state}.\n\n" + (
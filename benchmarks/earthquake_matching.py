@@ -0,0 +1,148 @@
+"""Compare per-guild country matching with the compiled, once-per-filter matcher.
+
+Run from the repository root in an environment with the cog requirements installed:
+
+    python -m benchmarks.earthquake_matching --guilds 10000 --quakes 300
+
+Each tick matches every new quake against the country filter of every subscribed
+guild, the way the alert loop does. The result is reported in milliseconds per tick.
+"""
+
+import argparse
+import random
+import time
+
+from earthquake.earthquake import COUNTRY_VARIANTS, match_countries, normalize_country_filter
+
+
+COUNTRIES = [
+    *COUNTRY_VARIANTS,
+    "japan",
+    "chile",
+    "indonesia",
+    "alaska",
+    "mexico",
+    "peru",
+    "new zealand",
+    "italy",
+    "papua new guinea",
+    "tonga",
+]
+PLACE_SUFFIXES = [
+    "Japan",
+    "Chile",
+    "Indonesia",
+    "Alaska",
+    "CA",
+    "Mexico",
+    "Peru",
+    "New Zealand",
+    "Italy",
+    "Norwegian Sea",
+    "Greece",
+    "Turkey",
+    "Philippine Islands region",
+    "south of the Fiji Islands",
+    "Iceland",
+    "central Mid-Atlantic Ridge",
+]
+
+
+def legacy_matches(country_filter: str, place: str) -> bool:
+    cf = country_filter.strip().lower()
+    pl = place.lower()
+    variants = COUNTRY_VARIANTS.get(cf, [cf])
+    return any(v in pl for v in variants)
+
+
+def make_guilds(count: int) -> list[dict]:
+    return [
+        {
+            "min_magnitude": random.choice([1.0, 2.5, 4.5, 5.0]),
+            "country_filter": (
+                random.choice(COUNTRIES).title() if random.random() < 0.7 else None
+            ),
+        }
+        for _ in range(count)
+    ]
+
+
+def make_quakes(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"us{number:08d}",
+            "properties": {
+                "mag": round(random.uniform(1.0, 7.5), 1),
+                "place": f"{random.randint(1, 200)} km NNE of Town, "
+                f"{random.choice(PLACE_SUFFIXES)}",
+            },
+        }
+        for number in range(count)
+    ]
+
+
+def legacy_tick(guilds: list[dict], quakes: list[dict]) -> int:
+    deliveries = 0
+    for settings in guilds:
+        country_filter = settings["country_filter"]
+        for quake in quakes:
+            if quake["properties"]["mag"] < settings["min_magnitude"]:
+                continue
+            if country_filter and not legacy_matches(country_filter, quake["properties"]["place"]):
+                continue
+            deliveries += 1
+    return deliveries
+
+
+def compiled_tick(guilds: list[dict], quakes: list[dict]) -> int:
+    places = {quake["id"]: quake["properties"]["place"].lower() for quake in quakes}
+    matched = match_countries(
+        places,
+        {
+            normalize_country_filter(settings["country_filter"])
+            for settings in guilds
+            if settings["country_filter"]
+        },
+    )
+    deliveries = 0
+    for settings in guilds:
+        country_filter = settings["country_filter"]
+        if country_filter:
+            country_filter = normalize_country_filter(country_filter)
+        for quake in quakes:
+            if quake["properties"]["mag"] < settings["min_magnitude"]:
+                continue
+            if country_filter and country_filter not in matched[quake["id"]]:
+                continue
+            deliveries += 1
+    return deliveries
+
+
+def measure(tick, guilds: list[dict], quakes: list[dict], repeat: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        deliveries = tick(guilds, quakes)
+    return (time.perf_counter() - start) / repeat * 1000, deliveries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=10_000)
+    parser.add_argument("--quakes", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    guilds = make_guilds(args.guilds)
+    quakes = make_quakes(args.quakes)
+    legacy_ms, legacy_deliveries = measure(legacy_tick, guilds, quakes, args.repeat)
+    compiled_ms, compiled_deliveries = measure(compiled_tick, guilds, quakes, args.repeat)
+    assert legacy_deliveries == compiled_deliveries
+    print(f"{args.guilds} guilds x {args.quakes} quakes, {compiled_deliveries} alerts per tick")
+    print(f"per-guild matching: {legacy_ms:.1f} ms/tick")
+    print(f"compiled matching:  {compiled_ms:.1f} ms/tick ({legacy_ms / compiled_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Simulate concurrent EasterHunt players against a scratch database.
+
+Run from the repository root in an environment with the cog requirements installed:
+
+    python -m benchmarks.easterhunt_hunters --hunters 500 --rounds 20
+    python -m benchmarks.easterhunt_hunters --hunters 500 --rounds 20 --no-tuning
+
+Each round a hunter finishes a hunt (one transaction), views their inventory and,
+every few rounds, the leaderboard. The result is reported in commands per second.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from easterhunt.db import Database
+
+
+class UntunedDatabase(Database):
+    """Database with the pre-WAL settings, for comparison."""
+
+    async def apply_pragmas(self):
+        await self.conn.execute("PRAGMA foreign_keys = ON")
+
+
+async def hunt(db: Database, user_id: int) -> None:
+    async with db.transaction():
+        row = await db.get_user_row(user_id)
+        await db.update_user(user_id, hunt_streak=row["hunt_streak"] + 1)
+        result = random.choices(["nothing", "common", "silver", "gold"], [50, 40, 6, 4])[0]
+        if result != "nothing":
+            await db.add_eggs(user_id, {result: random.randint(1, 10)})
+        pity = row["pity_counters"]
+        pity[result] = pity.get(result, 0) + 1
+        now = time.time()
+        await db.update_user(
+            user_id,
+            pity_counter_json=json.dumps(pity),
+            last_hunt=now,
+            last_hunt_time=now,
+            active_hunt=False,
+        )
+
+
+async def hunter(
+    db: Database, user_id: int, rounds: int, member_ids: list[int], counter: list[int]
+) -> None:
+    for round_number in range(rounds):
+        await hunt(db, user_id)
+        await db.get_user_row(user_id)
+        counter[0] += 2
+        if round_number % 5 == 0:
+            # What `easterhunt leaderboard` runs, with every hunter in one guild.
+            await db.get_leaderboard_totals(member_ids)
+            await db.get_global_rank(user_id)
+            counter[0] += 1
+
+
+async def run(hunters: int, rounds: int, tuned: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_class = Database if tuned else UntunedDatabase
+        db = db_class(None, db_path=Path(tmp) / "easterhunt.db")
+        await db.initialize()
+        counter = [0]
+        member_ids = list(range(1, hunters + 1))
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(hunter(db, user_id, rounds, member_ids, counter) for user_id in member_ids)
+        )
+        elapsed = time.perf_counter() - start
+        await db.close()
+    mode = "tuned" if tuned else "untuned"
+    print(
+        f"{mode}: {hunters} hunters x {rounds} rounds, {counter[0]} commands "
+        f"in {elapsed:.2f}s ({counter[0] / elapsed:.0f} commands/s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hunters", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--no-tuning", action="store_true", help="Use the old journal mode and pragmas."
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.hunters, args.rounds, not args.no_tuning))
+
+
+if __name__ == "__main__":
+    main()
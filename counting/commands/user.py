@@ -31,6 +31,8 @@ from redbot.core.utils.chat_formatting import box
 from redbot.core.utils.views import ConfirmView, SimpleMenu
 from tabulate import tabulate
 
+from ..leaderboard import LeaderboardPages
+
 
 class UserCommands(commands.Cog):
     @commands.hybrid_group()
@@ -74,50 +76,15 @@ class UserCommands(commands.Cog):
         Displays the top 15 users with the highest counts.
         Please note that the leaderboard only includes users who have counted at least once.
         """
-        user_cache: dict = self.settings._user_cache
-        entries = []
-        for user_id, data in user_cache.items():
-            if not data or data.get("count", 0) <= 0:
-                continue
-            member = ctx.guild.get_member(user_id)
-            if member is None or member.bot:
-                continue
-            entries.append((member, data["count"]))
-        if not entries:
+        index = self.settings.get_leaderboard(ctx.guild)
+        if not index:
             return await ctx.send("No one has counted yet in this server.")
-        entries.sort(key=lambda x: x[1], reverse=True)
-        invoker_pos = next(
-            (i + 1 for i, (m, _) in enumerate(entries) if m.id == ctx.author.id), None
-        )
-        footer_base = f"Total counters: {len(entries)}"
+        footer = f"Total counters: {len(index)}"
+        invoker_pos = index.rank(ctx.author.id)
         if invoker_pos and invoker_pos > 15:
-            invoker_count = next(c for m, c in entries if m.id == ctx.author.id)
-            footer_base += (
-                f" · Your rank: #{invoker_pos} ({cf.humanize_number(invoker_count)} counts)"
-            )
-        per_page = 15
-        total_pages = max(1, -(-len(entries) // per_page))
-        pages = []
-        for page_num, i in enumerate(range(0, len(entries), per_page), start=1):
-            chunk = entries[i : i + per_page]
-            table_data = [
-                [i + rank, member.display_name, cf.humanize_number(count)]
-                for rank, (member, count) in enumerate(chunk, start=1)
-            ]
-            table = tabulate(
-                table_data,
-                headers=["#", "User", "Count"],
-                tablefmt="simple",
-                stralign="left",
-                numalign="left",
-            )
-            embed = discord.Embed(
-                title="🏆 Counting Global Leaderboard",
-                description=box(table, lang="prolog"),
-                color=await ctx.embed_color(),
-            )
-            embed.set_footer(text=f"Page {page_num}/{total_pages} · {footer_base}")
-            pages.append(embed)
+            invoker_count = index.count(ctx.author.id)
+            footer += f" · Your rank: #{invoker_pos} ({cf.humanize_number(invoker_count)} counts)"
+        pages = LeaderboardPages(index, color=await ctx.embed_color(), footer=footer)
         await SimpleMenu(pages=pages, disable_after_timeout=True, timeout=120).start(ctx)
 
     @counting.command(name="resetme", with_app_command=False)
@@ -95,13 +95,28 @@ class Counting(UserCommands, AdminCommands, commands.Cog):
         """No user data to delete."""
         pass
 
-    def cog_unload(self):
-        self.event_handlers.remove_expired_roles.cancel()
+    async def cog_unload(self):
+        self.event_handlers.role_expiry_task.cancel()
+        self.settings.flush_loop.cancel()
+        await self.settings.flush()
+        self.settings.clear_leaderboards()
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
         await self.event_handlers.on_message(message)
 
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        self.settings.refresh_leaderboard_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        self.settings.refresh_leaderboard_member(member)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.settings.discard_leaderboard(guild.id)
+
     @commands.Cog.listener()
     async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
         await self.event_handlers.on_raw_message_edit(payload)
@@ -22,11 +22,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
+import contextlib
+import heapq
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any
 
 import discord
-from discord.ext import tasks
 from red_commons.logging import getLogger
 
 from .settings import SettingsManager
@@ -41,6 +44,8 @@ from .utils import (
 
 logger = getLogger("red.maxcogs.counting.event_handlers")
 
+ROLE_REMOVAL_RETRY_DELAY = 60
+
 
 class EventHandlers:
     """Handles Discord event listeners for the Counting cog."""
@@ -48,16 +53,60 @@ class EventHandlers:
     def __init__(self, bot, settings: SettingsManager):
         self.bot = bot
         self.settings = settings
-        self.remove_expired_roles = tasks.loop(minutes=1)(self._remove_expired_roles)
-        self.remove_expired_roles.before_loop(self._before_remove_expired_roles)
-        self.remove_expired_roles.start()
-
-    async def _remove_expired_roles(self):
-        for guild in self.bot.guilds:
-            await remove_expired_roles(self.settings.config, guild)
+        # Serializes count validation per guild so concurrent messages are judged in order.
+        self._count_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Min-heap of (expiry, guild_id, user_id, role_id) for temporary ruin roles.
+        self._role_expiries: list[tuple[float, int, int, int]] = []
+        self._role_expiry_wakeup = asyncio.Event()
+        self.role_expiry_task = self.bot.loop.create_task(self._run_role_expiries())
+
+    def schedule_role_expiry(
+        self, expiry: float, guild_id: int, user_id: int, role_id: int
+    ) -> None:
+        """Queue a temporary ruin role for removal at ``expiry``."""
+        heapq.heappush(self._role_expiries, (expiry, guild_id, user_id, role_id))
+        self._role_expiry_wakeup.set()
+
+    async def _load_role_expiries(self) -> None:
+        all_guilds = await self.settings.config.all_guilds()
+        for guild_id, data in all_guilds.items():
+            for user_id, entry in data.get("temp_roles", {}).items():
+                self._role_expiries.append(
+                    (entry["expiry"], guild_id, int(user_id), entry["role_id"])
+                )
+        heapq.heapify(self._role_expiries)
 
-    async def _before_remove_expired_roles(self):
+    async def _run_role_expiries(self) -> None:
+        """Sleep until the next temporary role expires and only visit guilds with something due."""
         await self.bot.wait_until_ready()
+        await self._load_role_expiries()
+        while True:
+            self._role_expiry_wakeup.clear()
+            now_ts = datetime.now(timezone.utc).timestamp()
+            if not self._role_expiries or self._role_expiries[0][0] > now_ts:
+                timeout = self._role_expiries[0][0] - now_ts if self._role_expiries else None
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._role_expiry_wakeup.wait(), timeout=timeout)
+                continue
+
+            due: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+            while self._role_expiries and self._role_expiries[0][0] <= now_ts:
+                _, guild_id, user_id, role_id = heapq.heappop(self._role_expiries)
+                due[guild_id].append((user_id, role_id))
+            for guild_id, entries in due.items():
+                # A guild can be briefly unavailable (startup, outage), so its removals
+                # are retried later instead of being dropped.
+                retry = entries
+                guild = self.bot.get_guild(guild_id)
+                if guild is not None:
+                    try:
+                        retry = await remove_expired_roles(self.settings.config, guild)
+                    except Exception:
+                        logger.exception("Failed to remove expired roles in guild %s", guild_id)
+                for user_id, role_id in retry:
+                    self.schedule_role_expiry(
+                        now_ts + ROLE_REMOVAL_RETRY_DELAY, guild_id, user_id, role_id
+                    )
 
     async def _handle_goal_reached(
         self, message: discord.Message, settings: dict[str, Any], reached_goal: int
@@ -107,71 +156,36 @@ class EventHandlers:
             logger.warning("Missing permissions in %s", message.channel.id)
             return
 
-        # Account age check
-        if settings["min_account_age"]:
-            account_age = (datetime.now(timezone.utc) - message.author.created_at).days
-            if account_age < settings["min_account_age"]:
-                await handle_invalid_count(
-                    message,
-                    f"Account must be at least {settings['min_account_age']} days old to count.",
-                    settings,
-                )
-                return
-
-        # Consecutive user check
-        if settings["same_user_to_count"] and settings["last_user_id"] == message.author.id:
-            await handle_invalid_count(message, settings["default_same_user_message"], settings)
-            return
-
-        expected_count = settings["count"] + 1
-
-        if not message.content.isdigit():
-            # Non-numeric message
-            if settings["allow_ruin"]:
-                await self._handle_count_ruin(
-                    message.channel, message.guild, message.author, settings
-                )
-            else:
-                response = settings["default_next_number_message"].format(
-                    next_count=expected_count
+        # Only validation and the cached counter update run under the guild lock;
+        # Discord calls happen after it is released and Config writes are deferred.
+        async with self._count_locks[message.guild.id]:
+            settings = await self.settings.get_guild_settings(message.guild)
+            invalid_response, send_response, wrong_number = self._check_count(message, settings)
+            ruined_at = None
+            if wrong_number and settings["allow_ruin"]:
+                ruined_at = self._reset_count(message.guild, settings)
+            elif invalid_response is None:
+                expected_count = settings["count"] + 1
+                user_settings = await self.settings.get_user_settings(message.author)
+                self.settings.defer_guild_update(
+                    message.guild, {"count": expected_count, "last_user_id": message.author.id}
                 )
-                await handle_invalid_count(
-                    message, response, settings, settings["toggle_next_number_message"]
+                self.settings.defer_user_update(
+                    message.author,
+                    {
+                        "count": user_settings["count"] + 1,
+                        "last_count_timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
                 )
-            return
 
-        message_count = int(message.content)
-        if message_count != expected_count:
-            if settings["allow_ruin"]:
-                await self._handle_count_ruin(
-                    message.channel, message.guild, message.author, settings
-                )
-            else:
-                response = settings["default_next_number_message"].format(
-                    next_count=expected_count
-                )
-                await handle_invalid_count(
-                    message, response, settings, settings["toggle_next_number_message"]
-                )
+        if ruined_at is not None:
+            await self._handle_count_ruin(
+                message.channel, message.guild, message.author, settings, ruined_at
+            )
+            return
+        if invalid_response is not None:
+            await handle_invalid_count(message, invalid_response, settings, send_response)
             return
-
-        now_iso = datetime.now(timezone.utc).isoformat()
-        user_settings = await self.settings.get_user_settings(message.author)
-        new_user_count = user_settings["count"] + 1
-        await self.settings.update_guild_multi(
-            message.guild,
-            {
-                "count": expected_count,
-                "last_user_id": message.author.id,
-            },
-        )
-        await self.settings.update_user_multi(
-            message.author,
-            {
-                "count": new_user_count,
-                "last_count_timestamp": now_iso,
-            },
-        )
 
         if settings["toggle_reactions"] and perms.add_reactions:
             await add_reaction(message, settings["default_reaction"])
@@ -202,17 +216,53 @@ class EventHandlers:
                     silent=settings["use_silent"],
                 )
 
+    def _check_count(
+        self, message: discord.Message, settings: dict[str, Any]
+    ) -> tuple[str | None, bool, bool]:
+        """Validate a message against the cached count.
+
+        Returns the response for an invalid count (``None`` if the count is valid),
+        whether that response should be sent, and whether the message was a wrong
+        number, which ruins the count when ``allow_ruin`` is enabled.
+        """
+        # Account age check
+        if settings["min_account_age"]:
+            account_age = (datetime.now(timezone.utc) - message.author.created_at).days
+            if account_age < settings["min_account_age"]:
+                return (
+                    f"Account must be at least {settings['min_account_age']} days old to count.",
+                    True,
+                    False,
+                )
+
+        # Consecutive user check
+        if settings["same_user_to_count"] and settings["last_user_id"] == message.author.id:
+            return settings["default_same_user_message"], True, False
+
+        expected_count = settings["count"] + 1
+        if not message.content.isdigit() or int(message.content) != expected_count:
+            response = settings["default_next_number_message"].format(next_count=expected_count)
+            return response, settings["toggle_next_number_message"], True
+        return None, True, False
+
+    def _reset_count(self, guild: discord.Guild, settings: dict[str, Any]) -> int:
+        """Reset the cached count and return the count it was ruined at."""
+        old_count = settings["count"]
+        self.settings.defer_guild_update(guild, {"count": 0, "last_user_id": None})
+        return old_count
+
     async def _handle_count_ruin(
         self,
         channel: discord.abc.Messageable,
         guild: discord.Guild,
         author: discord.Member | discord.Object,
         settings: dict[str, Any],
+        old_count: int,
     ) -> None:
-        old_count = settings["count"]
-        await self.settings.update_guild_multi(guild, {"count": 0, "last_user_id": None})
         if isinstance(author, discord.Member):
-            await assign_ruin_role(self.settings.config, author, guild, settings)
+            expiry = await assign_ruin_role(self.settings.config, author, guild, settings)
+            if expiry is not None:
+                self.schedule_role_expiry(expiry, guild.id, author.id, settings["ruin_role_id"])
         author_mention = getattr(author, "mention", f"<@{author.id}>")
         response = settings["ruin_message"].format(user=author_mention, count=old_count)
         delete_after = (
@@ -258,7 +308,9 @@ class EventHandlers:
 
         if settings["allow_ruin"]:
             author = guild.get_member(author_id) or discord.Object(id=author_id)
-            await self._handle_count_ruin(channel, guild, author, settings)
+            async with self._count_locks[guild.id]:
+                old_count = self._reset_count(guild, settings)
+            await self._handle_count_ruin(channel, guild, author, settings, old_count)
         elif settings["toggle_edit_message"]:
             response = settings["default_edit_message"].format(next_count=settings["count"] + 1)
             delete_after = (
@@ -0,0 +1,139 @@
+"""
+MIT License
+
+Copyright (c) 2022-present ltzmax
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Sequence
+
+import discord
+from redbot.core.utils import chat_formatting as cf
+from redbot.core.utils.chat_formatting import box
+from tabulate import tabulate
+
+
+class LeaderboardIndex:
+    """Guild members ordered by count (highest first), kept sorted as counts change."""
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        # (-count, user_id) so the natural sort order is highest count first.
+        self._entries: list[tuple[int, int]] = []
+        self._counts: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._counts
+
+    def update(self, user_id: int, count: int) -> None:
+        """Insert, move or drop a user depending on their new count and guild membership."""
+        self.discard(user_id)
+        if count <= 0:
+            return
+        member = self.guild.get_member(user_id)
+        if member is None or member.bot:
+            return
+        insort(self._entries, (-count, user_id))
+        self._counts[user_id] = count
+
+    def rebuild(self, counts: Iterable[tuple[int, int]]) -> None:
+        """Replace the index with the ranked members among ``(user_id, count)`` pairs."""
+        self._counts = {}
+        for user_id, count in counts:
+            if count <= 0:
+                continue
+            member = self.guild.get_member(user_id)
+            if member is not None and not member.bot:
+                self._counts[user_id] = count
+        self._entries = sorted((-count, user_id) for user_id, count in self._counts.items())
+
+    def discard(self, user_id: int) -> None:
+        old = self._counts.pop(user_id, None)
+        if old is not None:
+            del self._entries[bisect_left(self._entries, (-old, user_id))]
+
+    def rank(self, user_id: int) -> int | None:
+        """Return the 1-based rank of a user, or ``None`` if they are not ranked."""
+        count = self._counts.get(user_id)
+        if count is None:
+            return None
+        return bisect_left(self._entries, (-count, user_id)) + 1
+
+    def count(self, user_id: int) -> int:
+        return self._counts.get(user_id, 0)
+
+    def slice(self, start: int, stop: int) -> list[tuple[int, int]]:
+        """Return ``(user_id, count)`` pairs for ranks ``start + 1`` to ``stop``."""
+        return [(user_id, -neg_count) for neg_count, user_id in self._entries[start:stop]]
+
+
+class LeaderboardPages(Sequence):
+    """Embeds for SimpleMenu that are only rendered when a page is shown."""
+
+    def __init__(
+        self,
+        index: LeaderboardIndex,
+        *,
+        color: discord.Color,
+        footer: str,
+        per_page: int = 15,
+    ):
+        self.index = index
+        self.color = color
+        self.footer = footer
+        self.per_page = per_page
+        self._total_pages = max(1, -(-len(index) // per_page))
+
+    def __len__(self) -> int:
+        return self._total_pages
+
+    def __getitem__(self, page: int) -> discord.Embed:
+        if isinstance(page, slice):
+            return [self[i] for i in range(*page.indices(len(self)))]
+        if page < 0:
+            page += self._total_pages
+        if not 0 <= page < self._total_pages:
+            raise IndexError(page)
+        start = page * self.per_page
+        table_data = []
+        for rank, (user_id, count) in enumerate(
+            self.index.slice(start, start + self.per_page), start=start + 1
+        ):
+            member = self.index.guild.get_member(user_id)
+            name = member.display_name if member else str(user_id)
+            table_data.append([rank, name, cf.humanize_number(count)])
+        table = tabulate(
+            table_data,
+            headers=["#", "User", "Count"],
+            tablefmt="simple",
+            stralign="left",
+            numalign="left",
+        )
+        embed = discord.Embed(
+            title="🏆 Counting Global Leaderboard",
+            description=box(table, lang="prolog"),
+            color=self.color,
+        )
+        embed.set_footer(text=f"Page {page + 1}/{self._total_pages} · {self.footer}")
+        return embed
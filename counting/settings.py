@@ -22,11 +22,22 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
+from collections.abc import Callable
 from typing import Any
 
 import discord
+from discord.ext import tasks
+from red_commons.logging import getLogger
 from redbot.core import Config
 
+from .leaderboard import LeaderboardIndex
+
+
+logger = getLogger("red.maxcogs.counting.settings")
+
+FLUSH_INTERVAL = 10
+
 
 class SettingsManager:
     """Manages guild and user settings with caching."""
@@ -35,12 +46,19 @@ class SettingsManager:
         self.config = config
         self._guild_cache: dict[int, dict[str, Any]] = {}
         self._user_cache: dict[int, dict[str, Any]] = {}
+        # id -> keys whose cached value has not been written to Config yet.
+        self._dirty_guilds: dict[int, set[str]] = {}
+        self._dirty_users: dict[int, set[str]] = {}
+        # guild_id -> ranked index, built on first leaderboard view and kept in sync after.
+        self._leaderboards: dict[int, LeaderboardIndex] = {}
+        self.flush_loop = tasks.loop(seconds=FLUSH_INTERVAL)(self.flush)
 
     async def initialize(self) -> None:
         """Load guild and user settings into cache, then run one-time migrations."""
         self._guild_cache = await self.config.all_guilds()
         self._user_cache = await self.config.all_users()
         await self._migrate_legacy_goals()
+        self.flush_loop.start()
 
     # will be removed later just to make sure everyone gets
     # the new goals field over from goal without needing to use the command again.
@@ -102,6 +120,8 @@ class SettingsManager:
         if user.id not in self._user_cache:
             self._user_cache[user.id] = await self.config.user(user).all()
         self._user_cache[user.id][key] = value
+        if key == "count":
+            self._sync_leaderboard(user, value)
 
     async def update_user_multi(self, user: discord.Member, updates: dict[str, Any]) -> None:
         """Batch-update multiple user config keys in a single config write."""
@@ -111,13 +131,94 @@ class SettingsManager:
         if user.id not in self._user_cache:
             self._user_cache[user.id] = await self.config.user(user).all()
         self._user_cache[user.id].update(updates)
+        if "count" in updates:
+            self._sync_leaderboard(user, updates["count"])
+
+    def defer_guild_update(self, guild: discord.Guild, updates: dict[str, Any]) -> None:
+        """Update cached guild settings now and leave the Config write to `flush`."""
+        self._guild_cache[guild.id].update(updates)
+        self._dirty_guilds.setdefault(guild.id, set()).update(updates)
+
+    def defer_user_update(self, user: discord.Member, updates: dict[str, Any]) -> None:
+        """Update cached user settings now and leave the Config write to `flush`."""
+        self._user_cache[user.id].update(updates)
+        self._dirty_users.setdefault(user.id, set()).update(updates)
+        if "count" in updates:
+            self._sync_leaderboard(user, updates["count"])
+
+    def get_leaderboard(self, guild: discord.Guild) -> LeaderboardIndex:
+        """Return the ranked index for a guild, building it from the user cache once."""
+        index = self._leaderboards.get(guild.id)
+        if index is None:
+            index = LeaderboardIndex(guild)
+            index.rebuild(
+                (user_id, data.get("count", 0)) for user_id, data in self._user_cache.items()
+            )
+            self._leaderboards[guild.id] = index
+        return index
+
+    def discard_leaderboard(self, guild_id: int) -> None:
+        self._leaderboards.pop(guild_id, None)
+
+    def clear_leaderboards(self) -> None:
+        self._leaderboards.clear()
+
+    def refresh_leaderboard_member(self, member: discord.Member) -> None:
+        """Re-rank a member after they join or leave a guild."""
+        index = self._leaderboards.get(member.guild.id)
+        if index is not None:
+            index.update(member.id, self._user_cache.get(member.id, {}).get("count", 0))
+
+    def _sync_leaderboard(self, member: discord.Member, count: int) -> None:
+        """Re-rank the member in every cached index whose guild they are in.
+
+        Counts are global, so a count in one guild moves the member on each of their
+        guilds' leaderboards. Only guilds that have shown a leaderboard have an index.
+        """
+        for index in self._leaderboards.values():
+            if member.id in index or index.guild.get_member(member.id) is not None:
+                index.update(member.id, count)
+
+    async def flush(self) -> None:
+        """Write all dirty cached values to Config, one write per guild and per user.
+
+        Runs periodically from `flush_loop` and once more when the cog unloads,
+        which also happens on bot shutdown.
+        """
+        await self._flush_dirty(self._dirty_guilds, self._guild_cache, self.config.guild_from_id)
+        await self._flush_dirty(self._dirty_users, self._user_cache, self.config.user_from_id)
+
+    async def _flush_dirty(
+        self,
+        dirty: dict[int, set[str]],
+        cache: dict[int, dict[str, Any]],
+        group: Callable[[int], Any],
+    ) -> None:
+        for obj_id in list(dirty):
+            keys = dirty.pop(obj_id)
+            cached = cache.get(obj_id)
+            if cached is None:
+                continue
+            try:
+                async with group(obj_id).all() as data:
+                    for key in keys:
+                        data[key] = cached[key]
+            except asyncio.CancelledError:
+                dirty.setdefault(obj_id, set()).update(keys)
+                raise
+            except Exception:
+                dirty.setdefault(obj_id, set()).update(keys)
+                logger.exception("Failed to flush counting settings for %s", obj_id)
 
     async def clear_guild(self, guild: discord.Guild) -> None:
         """Clear guild settings and refresh cache."""
+        self._dirty_guilds.pop(guild.id, None)
         await self.config.guild(guild).clear()
         self._guild_cache[guild.id] = await self.config.guild(guild).all()
 
     async def clear_user(self, user: discord.Member) -> None:
         """Clear user settings and refresh cache."""
+        self._dirty_users.pop(user.id, None)
         await self.config.user(user).clear()
         self._user_cache[user.id] = {"count": 0, "last_count_timestamp": None}
+        self._sync_leaderboard(user, 0)
@@ -98,27 +98,30 @@ async def handle_invalid_count(
 
 async def assign_ruin_role(
     config: Config, member: discord.Member, guild: discord.Guild, settings: dict[str, Any]
-) -> None:
-    """Assign the ruin role to a member, temporarily if a duration is set."""
+) -> float | None:
+    """Assign the ruin role to a member, temporarily if a duration is set.
+
+    Returns the expiry timestamp of a temporary role so the caller can schedule its removal.
+    """
     ruin_role_id = settings["ruin_role_id"]
     duration = settings["ruin_role_duration"]
     excluded_role_ids = settings["excluded_roles"]
 
     if not ruin_role_id:
-        return
+        return None
 
     role = guild.get_role(ruin_role_id)
     if not role or role >= guild.me.top_role:
         logger.warning("Cannot assign ruin role %s in %s (%s)", ruin_role_id, guild.name, guild.id)
-        return
+        return None
 
     if any(r.id in excluded_role_ids for r in member.roles):
         logger.warning("User %s has excluded role(s) in %s", member.display_name, guild.name)
-        return
+        return None
 
     if not guild.me.guild_permissions.manage_roles:
         logger.warning("Missing manage_roles permission in %s (%s)", guild.name, guild.id)
-        return
+        return None
 
     try:
         await member.add_roles(role, reason="Ruined the count")
@@ -129,12 +132,18 @@ async def assign_ruin_role(
                     "role_id": role.id,
                     "expiry": expiry.timestamp(),
                 }
+            return expiry.timestamp()
     except discord.Forbidden:
         logger.warning("Missing permissions to assign role %s in %s", role.name, guild.name)
+    return None
+
 
+async def remove_expired_roles(config: Config, guild: discord.Guild) -> list[tuple[int, int]]:
+    """Remove expired temporary roles from users in a guild.
 
-async def remove_expired_roles(config: Config, guild: discord.Guild) -> None:
-    """Remove expired temporary roles from users in a guild."""
+    Returns ``(user_id, role_id)`` pairs that expired but could not be removed yet.
+    """
+    retry: list[tuple[int, int]] = []
     async with config.guild(guild).temp_roles() as temp_roles:
         to_remove = []
         now_ts = datetime.now(timezone.utc).timestamp()
@@ -165,12 +174,15 @@ async def remove_expired_roles(config: Config, guild: discord.Guild) -> None:
                                 member.id,
                                 retry_err,
                             )
-                            continue  # Don't mark for removal; try again next tick
+                            retry.append((int(user_id), data["role_id"]))
+                            continue  # Don't mark for removal; try again later
                     elif isinstance(e, discord.Forbidden):
                         logger.warning("Forbidden removing role %s: %s", role.name, e)
                     else:
                         logger.error("Unexpected error removing role %s: %s", role.name, e)
+                        retry.append((int(user_id), data["role_id"]))
                         continue  # Don't mark for removal to avoid silently losing the entry
             to_remove.append(user_id)
         for user_id in to_remove:
             del temp_roles[user_id]
+    return retry
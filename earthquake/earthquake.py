@@ -24,6 +24,10 @@ SOFTWARE.
 
 import asyncio
 import datetime
+import functools
+import re
+from collections import deque
+from time import monotonic
 from typing import Final
 
 import aiohttp
@@ -37,6 +41,14 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 
 logger = getLogger("red.maxcogs.earthquake")
 
+USGS_FEED_URL = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/{feed}.geojson"
+# After a successful fetch this recent (seconds), the hour feed still covers every new event.
+HOUR_FEED_WINDOW = 30 * 60
+SEEN_IDS_LIMIT = 500
+
+# How many guilds receive alerts at the same time.
+ALERT_CONCURRENCY = 25
+
 # Maps common country names to all USGS place string variants for that country.
 # USGS uses adjective forms for seas/regions (e.g. "Norwegian Sea" not "Norway Sea").
 COUNTRY_VARIANTS: dict[str, list[str]] = {
@@ -59,12 +71,30 @@ COUNTRY_VARIANTS: dict[str, list[str]] = {
 }
 
 
-def _country_matches(country_filter: str, place: str) -> bool:
-    """Check if a USGS place string matches a country filter, including regional variants."""
-    cf = country_filter.strip().lower()
-    pl = place.lower()
-    variants = COUNTRY_VARIANTS.get(cf, [cf])
-    return any(v in pl for v in variants)
+def normalize_country_filter(country_filter: str) -> str:
+    return country_filter.strip().lower()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_country_filter(country_filter: str) -> re.Pattern[str]:
+    """Compile one pattern matching every USGS place variant of a normalized filter."""
+    variants = COUNTRY_VARIANTS.get(country_filter, [country_filter])
+    return re.compile("|".join(map(re.escape, variants)))
+
+
+def match_countries(places: dict[str, str], country_filters: set[str]) -> dict[str, set[str]]:
+    """Map each quake id to the normalized country filters its place matches.
+
+    ``places`` maps quake ids to lowercased USGS place strings. Each distinct filter is
+    matched once per quake, however many guilds use it.
+    """
+    matches: dict[str, set[str]] = {quake_id: set() for quake_id in places}
+    for country_filter in country_filters:
+        pattern = _compile_country_filter(country_filter)
+        for quake_id, place in places.items():
+            if pattern.search(place):
+                matches[quake_id].add(country_filter)
+    return matches
 
 
 class Earthquake(commands.Cog):
@@ -93,7 +123,27 @@ class Earthquake(commands.Cog):
         }
         self.config.register_guild(**default_settings)
         self.config.register_global(**default_global)
+        # {"id": ..., "token": ...} of the alert webhook created in the channel.
+        self.config.register_channel(webhook=None)
         self.session = aiohttp.ClientSession(json_serialize=orjson.dumps)
+        self._webhooks: dict[int, discord.Webhook] = {}
+        # guild_id -> settings, only for guilds with an alert channel set.
+        self._subscriptions: dict[int, dict] = {}
+        self._min_magnitude = 4.5
+        self._last_processed_time = 0
+        self._seen_ids: set[str] = set()
+        self._seen_order: deque[str] = deque(maxlen=SEEN_IDS_LIMIT)
+        # url -> (ETag, Last-Modified) of the last full feed response.
+        self._feed_validators: dict[str, tuple[str | None, str | None]] = {}
+        self._last_feed_fetch = float("-inf")
+
+    async def cog_load(self) -> None:
+        for guild_id, settings in (await self.config.all_guilds()).items():
+            if settings.get("channel"):
+                self._subscriptions[guild_id] = settings
+        self._update_min_magnitude()
+        self._last_processed_time = await self.config.last_processed_time()
+        self._remember_seen(await self.config.seen_ids())
         self.earthquake_check.start()
 
     def format_help_for_context(self, ctx: commands.Context) -> str:
@@ -106,8 +156,23 @@ class Earthquake(commands.Cog):
         pass
 
     async def get_guild_settings(self) -> dict[int, dict]:
-        """Cache guild settings to reduce config calls."""
-        return {guild.id: await self.config.guild(guild).all() for guild in self.bot.guilds}
+        """Return the settings of every guild with an alert channel set."""
+        return self._subscriptions
+
+    async def refresh_guild_settings(self, guild: discord.Guild) -> None:
+        """Update the subscription snapshot after a guild's settings changed."""
+        settings = await self.config.guild(guild).all()
+        if settings.get("channel"):
+            self._subscriptions[guild.id] = settings
+        else:
+            self._subscriptions.pop(guild.id, None)
+        self._update_min_magnitude()
+
+    def _update_min_magnitude(self) -> None:
+        self._min_magnitude = min(
+            (settings["min_magnitude"] for settings in self._subscriptions.values()),
+            default=4.5,
+        )
 
     @retry(
         stop=stop_after_attempt(3),
@@ -117,7 +182,12 @@ class Earthquake(commands.Cog):
             "Retrying USGS fetch (attempt %s)", retry_state.attempt_number
         ),
     )
-    async def fetch_earthquakes(self, min_magnitude: float = 1.0) -> list[dict]:
+    async def fetch_earthquakes(self, min_magnitude: float = 1.0, since: int = 0) -> list[dict]:
+        """Return the feed's events newer than ``since`` (ms), newest first.
+
+        Requests are conditional, so an unchanged feed returns nothing without being parsed.
+        While fetches keep succeeding the hour feed is used; after a gap, the day feed.
+        """
         try:
             min_magnitude = float(min_magnitude)
             if not 1.0 <= min_magnitude <= 10.0:
@@ -127,8 +197,18 @@ class Earthquake(commands.Cog):
             logger.error("Invalid min_magnitude value: %s", min_magnitude)
             return []
 
-        url = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary/all_day.geojson"
-        async with self.session.get(url, timeout=10) as response:
+        feed = "all_hour" if monotonic() - self._last_feed_fetch < HOUR_FEED_WINDOW else "all_day"
+        url = USGS_FEED_URL.format(feed=feed)
+        headers = {}
+        etag, last_modified = self._feed_validators.get(url, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        async with self.session.get(url, timeout=10, headers=headers) as response:
+            if response.status == 304:
+                self._last_feed_fetch = monotonic()
+                return []
             if response.status != 200:
                 logger.error(
                     "USGS API returned %s: %s",
@@ -141,15 +221,33 @@ class Earthquake(commands.Cog):
             if not isinstance(data, dict) or "features" not in data:
                 logger.error("Invalid USGS API response format")
                 return []
-            return [
-                eq
-                for eq in data["features"]
-                if isinstance(eq, dict)
-                and "properties" in eq
-                and "geometry" in eq
-                and isinstance(eq["properties"].get("mag"), (int, float))
-                and eq["properties"]["mag"] >= min_magnitude
-            ]
+            self._feed_validators[url] = (
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+            self._last_feed_fetch = monotonic()
+
+        earthquakes = []
+        # Feed events are ordered newest first, so stop at the first one already processed.
+        for eq in data["features"]:
+            if not isinstance(eq, dict) or "properties" not in eq or "geometry" not in eq:
+                continue
+            event_time = eq["properties"].get("time")
+            if not isinstance(event_time, (int, float)):
+                continue
+            if event_time <= since:
+                break
+            magnitude = eq["properties"].get("mag")
+            if isinstance(magnitude, (int, float)) and magnitude >= min_magnitude:
+                earthquakes.append(eq)
+        return earthquakes
+
+    def _remember_seen(self, quake_ids: list[str]) -> None:
+        for quake_id in quake_ids:
+            if len(self._seen_order) == SEEN_IDS_LIMIT:
+                self._seen_ids.discard(self._seen_order[0])
+            self._seen_order.append(quake_id)
+            self._seen_ids.add(quake_id)
 
     async def cog_unload(self):
         self.earthquake_check.cancel()
@@ -164,38 +262,39 @@ class Earthquake(commands.Cog):
             if not guild_settings:
                 return
 
-            min_magnitudes = [
-                settings["min_magnitude"]
-                for settings in guild_settings.values()
-                if settings.get("channel")
-            ]
-            fetch_magnitude = min(min_magnitudes, default=4.5) if min_magnitudes else 4.5
-            earthquakes = await self.fetch_earthquakes(min_magnitude=fetch_magnitude)
-            if not earthquakes:
-                return
-
-            last_processed_time = await self.config.last_processed_time()
-            seen_ids: list = await self.config.seen_ids()
-
-            valid_earthquakes = [
-                eq
-                for eq in earthquakes
-                if eq["properties"].get("time", 0) > last_processed_time
-                and eq["id"] not in seen_ids
-                and isinstance(eq["properties"].get("mag"), (int, float))
-                and "time" in eq["properties"]
-            ]
+            earthquakes = await self.fetch_earthquakes(
+                min_magnitude=self._min_magnitude, since=self._last_processed_time
+            )
             new_earthquakes = sorted(
-                valid_earthquakes, key=lambda eq: eq["properties"]["time"], reverse=True
+                (eq for eq in earthquakes if eq["id"] not in self._seen_ids),
+                key=lambda eq: eq["properties"]["time"],
+                reverse=True,
             )
             if not new_earthquakes:
                 return
 
-            # Update seen IDs keep last 500 to avoid unbounded growth
-            new_ids = [eq["id"] for eq in new_earthquakes]
-            updated_ids = (seen_ids + new_ids)[-500:]
-            await self.config.seen_ids.set(updated_ids)
-            await self.config.last_processed_time.set(new_earthquakes[0]["properties"]["time"])
+            # Keep the last SEEN_IDS_LIMIT ids; Config is only written when they change.
+            self._remember_seen([eq["id"] for eq in new_earthquakes])
+            self._last_processed_time = new_earthquakes[0]["properties"]["time"]
+            await self.config.seen_ids.set(list(self._seen_order))
+            await self.config.last_processed_time.set(self._last_processed_time)
+            # The alert text is rendered once per quake, and one view is shared by every
+            # guild using the same safety message.
+            rendered = {eq["id"]: self.render_earthquake(eq) for eq in new_earthquakes}
+            views: dict[tuple[str, str], discord.ui.LayoutView] = {}
+            places = {
+                eq["id"]: (eq["properties"].get("place") or "").lower() for eq in new_earthquakes
+            }
+            matched_countries = match_countries(
+                places,
+                {
+                    normalize_country_filter(settings["country_filter"])
+                    for settings in guild_settings.values()
+                    if settings.get("country_filter")
+                },
+            )
+            semaphore = asyncio.Semaphore(ALERT_CONCURRENCY)
+            deliveries = []
             for guild_id, settings in guild_settings.items():
                 channel_id = settings.get("channel")
                 if not channel_id:
@@ -209,15 +308,35 @@ class Earthquake(commands.Cog):
 
                 min_magnitude = settings["min_magnitude"]
                 country_filter = settings.get("country_filter")
+                if country_filter:
+                    country_filter = normalize_country_filter(country_filter)
+                safety_message = settings["safety_message"]
+                guild_views = []
                 for earthquake in new_earthquakes:
                     magnitude = earthquake["properties"].get("mag")
                     if magnitude is None or magnitude < min_magnitude:
                         continue
-                    if country_filter:
-                        place = earthquake["properties"].get("place", "")
-                        if not _country_matches(country_filter, place):
-                            continue
-                    await self.post_earthquake(guild, channel, earthquake)
+                    if (
+                        country_filter
+                        and country_filter not in matched_countries[earthquake["id"]]
+                    ):
+                        continue
+                    key = (earthquake["id"], safety_message)
+                    if key not in views:
+                        body, url = rendered[earthquake["id"]]
+                        views[key] = self.build_alert_view(
+                            body, url, safety_message, earthquake["id"]
+                        )
+                    guild_views.append(views[key])
+                if guild_views:
+                    deliveries.append(
+                        self._deliver_alerts(semaphore, guild, channel, settings, guild_views)
+                    )
+
+            results = await asyncio.gather(*deliveries, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Error delivering earthquake alert: %s", result, exc_info=result)
 
         except asyncio.CancelledError:
             logger.info("Earthquake check task cancelled during shutdown")
@@ -226,7 +345,20 @@ class Earthquake(commands.Cog):
             logger.error("Error in earthquake_check: %s", e, exc_info=True)
 
     async def get_or_create_webhook(self, channel: discord.TextChannel) -> discord.Webhook | None:
-        """Get or create a webhook for earthquake alerts in the channel."""
+        """Get or create a webhook for earthquake alerts in the channel.
+
+        The webhook's id and token are kept in memory and in Config, so alerts reuse it
+        without listing the channel's webhooks until `forget_webhook` is called.
+        """
+        wh = self._webhooks.get(channel.id)
+        if wh is not None:
+            return wh
+        data = await self.config.channel(channel).webhook()
+        if data:
+            wh = discord.Webhook.partial(data["id"], data["token"], client=self.bot)
+            self._webhooks[channel.id] = wh
+            return wh
+
         our_name = "Earthquake Alert Webhook"
         try:
             webhooks = await channel.webhooks()
@@ -234,15 +366,18 @@ class Earthquake(commands.Cog):
             return None
 
         for wh in webhooks:
-            if wh.name == our_name and wh.user == self.bot.user:
+            if wh.name == our_name and wh.user == self.bot.user and wh.token:
+                await self._remember_webhook(channel, wh)
                 return wh
 
         try:
             wh = await channel.create_webhook(name=our_name)
+            await self._remember_webhook(channel, wh)
             return wh
         except discord.HTTPException as e:
             if e.code == 30007:
                 await self.config.guild(channel.guild).use_webhook.set(False)
+                await self.refresh_guild_settings(channel.guild)
                 logger.warning(
                     "Maximum number of webhooks reached in %s for guild %s. Disabling webhook use.",
                     channel.name,
@@ -265,10 +400,30 @@ class Earthquake(commands.Cog):
             )
             return None
 
-    async def post_earthquake(
-        self, guild: discord.Guild, channel: discord.TextChannel, earthquake: dict
-    ):
-        """Post an earthquake alert to the specified channel."""
+    async def _remember_webhook(self, channel: discord.TextChannel, wh: discord.Webhook) -> None:
+        self._webhooks[channel.id] = wh
+        await self.config.channel(channel).webhook.set({"id": wh.id, "token": wh.token})
+
+    async def forget_webhook(self, channel: discord.TextChannel) -> None:
+        """Drop the cached webhook of a channel after Discord reported it as unknown."""
+        self._webhooks.pop(channel.id, None)
+        await self.config.channel(channel).webhook.clear()
+
+    async def _deliver_alerts(
+        self,
+        semaphore: asyncio.Semaphore,
+        guild: discord.Guild,
+        channel: discord.TextChannel,
+        settings: dict,
+        views: list[discord.ui.LayoutView],
+    ) -> None:
+        """Post a guild's alerts in order, while the semaphore bounds how many guilds send at once."""
+        async with semaphore:
+            for view in views:
+                await self.post_earthquake(guild, channel, settings, view)
+
+    def render_earthquake(self, earthquake: dict) -> tuple[str, str]:
+        """Return the alert text shared by every guild and the USGS event URL."""
         properties = earthquake["properties"]
         geometry = earthquake["geometry"]
         magnitude = properties.get("mag", 0.0)
@@ -288,7 +443,6 @@ class Earthquake(commands.Cog):
         tsunami = "⚠️ Yes" if properties.get("tsunami", 0) == 1 else "No"
         felt_reports = properties.get("felt")
         alert_level = properties.get("alert")
-        safety_message = await self.config.guild(guild).safety_message()
 
         mag_emoji = (
             "🟢"
@@ -311,13 +465,19 @@ class Earthquake(commands.Cog):
             lines.append(f"**🤝 Felt Reports:** {felt_reports}")
         if alert_level is not None:
             lines.append(f"**🚨 Alert Level:** {alert_level.capitalize()}")
-        lines.append(f"\n-# ⚠️ {safety_message}")
-        lines.append(f"-# USGS · ID: {earthquake['id']}")
+        return "\n".join(lines), url
 
+    @staticmethod
+    def build_alert_view(
+        body: str, url: str, safety_message: str, earthquake_id: str
+    ) -> discord.ui.LayoutView:
+        """Build the alert view from a rendered body and a guild's safety message."""
         view = discord.ui.LayoutView(timeout=None)
         view.add_item(
             discord.ui.Container(
-                discord.ui.TextDisplay("\n".join(lines)),
+                discord.ui.TextDisplay(
+                    f"{body}\n\n-# ⚠️ {safety_message}\n-# USGS · ID: {earthquake_id}"
+                ),
                 discord.ui.Separator(),
                 discord.ui.ActionRow(
                     discord.ui.Button(
@@ -329,19 +489,27 @@ class Earthquake(commands.Cog):
                 ),
             )
         )
+        return view
 
-        ping_role_id = await self.config.guild(guild).ping_role()
-        content = (
-            guild.get_role(ping_role_id).mention
-            if ping_role_id and guild.get_role(ping_role_id)
-            else ""
-        )
+    async def post_earthquake(
+        self,
+        guild: discord.Guild,
+        channel: discord.TextChannel,
+        settings: dict,
+        view: discord.ui.LayoutView,
+    ):
+        """Post a rendered earthquake alert to the channel using the guild's settings."""
+        ping_role_id = settings.get("ping_role")
+        ping_role = guild.get_role(ping_role_id) if ping_role_id else None
+        content = ping_role.mention if ping_role else ""
 
-        use_webhook = await self.config.guild(guild).use_webhook()
         sent = False
-        if use_webhook and channel.permissions_for(guild.me).manage_webhooks:
-            wh = await self.get_or_create_webhook(channel)
-            if wh:
+        if settings.get("use_webhook") and channel.permissions_for(guild.me).manage_webhooks:
+            # A cached webhook that was deleted is forgotten and recreated once.
+            for _attempt in range(2):
+                wh = await self.get_or_create_webhook(channel)
+                if not wh:
+                    break
                 try:
                     await wh.send(
                         content=content or None,
@@ -351,8 +519,12 @@ class Earthquake(commands.Cog):
                         allowed_mentions=discord.AllowedMentions(roles=True),
                     )
                     sent = True
+                    break
+                except discord.NotFound:
+                    await self.forget_webhook(channel)
                 except (discord.Forbidden, discord.HTTPException) as e:
                     logger.error("Failed to send via webhook in %s: %s", guild.name, e)
+                    break
 
         if not sent:
             if not channel.permissions_for(guild.me).send_messages:
@@ -402,6 +574,7 @@ class Earthquake(commands.Cog):
         if not ctx.guild.me.guild_permissions.manage_webhooks:
             return await ctx.send("I need the `manage_webhooks` permission to use webhooks.")
         await self.config.guild(ctx.guild).use_webhook.set(use_webhook)
+        await self.refresh_guild_settings(ctx.guild)
         status = "enabled" if use_webhook else "disabled"
         await ctx.send(f"Webhook usage for earthquake alerts has been {status}.")
 
@@ -417,9 +590,11 @@ class Earthquake(commands.Cog):
                     "I need `send_messages` and `embed_links` permissions in that channel."
                 )
             await self.config.guild(ctx.guild).channel.set(channel.id)
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send(f"Earthquake alerts will be sent to {channel.mention}.")
         else:
             await self.config.guild(ctx.guild).channel.set(None)
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send("Earthquake alerts disabled for this server.")
 
     @earthquakeset.command(name="role")
@@ -432,9 +607,11 @@ class Earthquake(commands.Cog):
             if role.is_default() or role.is_everyone() or role.name == "@here":
                 return await ctx.send("Cannot set `@everyone` or `@here` as ping roles.")
             await self.config.guild(ctx.guild).ping_role.set(role.id)
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send(f"Earthquake alerts will ping {role.mention}.")
         else:
             await self.config.guild(ctx.guild).ping_role.set(None)
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send("Role pings disabled for earthquake alerts.")
 
     @earthquakeset.command(name="magnitude")
@@ -454,6 +631,7 @@ class Earthquake(commands.Cog):
         - `[magnitude]`: The minimum magnitude for alerts (default is 4.5, range 1.0 to 10.0).
         """
         await self.config.guild(ctx.guild).min_magnitude.set(magnitude)
+        await self.refresh_guild_settings(ctx.guild)
         await ctx.send(
             f"Minimum magnitude for alerts set to {magnitude:.1f}.\n-# Note: Lower values may result in frequent notifications."
         )
@@ -465,11 +643,13 @@ class Earthquake(commands.Cog):
             if len(message) > 1024:
                 return await ctx.send("Safety message cannot exceed 1024 characters in length.")
             await self.config.guild(ctx.guild).safety_message.set(message)
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send("Custom safety message set.")
         else:
             await self.config.guild(ctx.guild).safety_message.set(
                 "*Monitor local news and follow instructions from emergency officials.*"
             )
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send("Safety message reset to default.")
 
     @earthquakeset.command(name="country")
@@ -492,6 +672,7 @@ class Earthquake(commands.Cog):
         """
         if country:
             await self.config.guild(ctx.guild).country_filter.set(country.strip())
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send(
                 f"Earthquake alerts will now be filtered to **{country.strip()}**.\n"
                 f"-# Note: This matches against USGS location strings. If you receive no alerts, "
@@ -499,6 +680,7 @@ class Earthquake(commands.Cog):
             )
         else:
             await self.config.guild(ctx.guild).country_filter.set(None)
+            await self.refresh_guild_settings(ctx.guild)
             await ctx.send(
                 "Country filter cleared. You will now receive global earthquake alerts."
             )
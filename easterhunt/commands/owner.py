@@ -108,9 +108,10 @@ class OwnerCommands(commands.Cog):
         """
         Reset a specific user's Easter hunt data.
         """
-        eggs = await self.db.get_eggs(user.id)
-        shards = await self.db.get_user_field(user.id, "shards")
-        gems = await self.db.get_user_field(user.id, "gems")
+        row = await self.db.get_user_row(user.id)
+        eggs = row["eggs"]
+        shards = row["shards"]
+        gems = row["gems"]
         if not any(eggs.values()) and shards == 0 and gems == 0:
             return await ctx.send(
                 f"{user.mention} doesn't have any data to reset!",
@@ -164,10 +165,11 @@ class OwnerCommands(commands.Cog):
         if not view.result:
             return await ctx.send("Reset cancelled.")
 
-        await self.db.set_user_field(user.id, "active_hunt", False)
-        await self.db.set_user_field(user.id, "active_work", False)
-        await self.db.set_user_field(user.id, "last_work", 0)
-        await self.db.set_user_field(user.id, "active_job_type", None)
+        async with self.db.transaction():
+            await self.db.delete_job(user.id)
+            await self.db.update_user(
+                user.id, active_hunt=False, active_work=False, last_work=0, active_job_type=None
+            )
         await ctx.send(
             f"{user.mention}'s Easter hunt and work data has been reset by {ctx.author.mention}!"
         )
@@ -70,15 +70,16 @@ class UserCommands(commands.Cog):
         - common egg, silver egg, gold egg, shiny egg, legendary egg, and mythical egg.
         """
         user = ctx.author
+        row = await self.db.get_user_row(user.id)
 
-        if await self.db.get_user_field(user.id, "active_hunt"):
+        if row["active_hunt"]:
             return await ctx.send(
                 "you're already on a hunt! Wait for the Easter Bunny to return!",
                 reference=ctx.message.to_reference(fail_if_not_exists=False),
                 mention_author=False,
             )
 
-        if await self.db.get_user_field(user.id, "active_work"):
+        if row["active_work"]:
             return await ctx.send(
                 "you're on work, you cannot hunt until you've finished work!",
                 reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -86,7 +87,7 @@ class UserCommands(commands.Cog):
             )
 
         current_time = time.time()
-        can_hunt, cooldown_message = await check_hunt_cooldown(self.db, user.id, current_time)
+        can_hunt, cooldown_message = check_hunt_cooldown(row, current_time)
         if not can_hunt:
             return await ctx.send(
                 cooldown_message,
@@ -102,57 +103,65 @@ class UserCommands(commands.Cog):
         )
 
         event_task = None
+        finished = False
         try:
             event_task = asyncio.create_task(self.send_hunt_events(ctx.channel, user))
             await asyncio.sleep(60)
-            current_streak = await update_hunt_streak(self.db, user.id, current_time)
-            (
-                adjusted_chances,
-                pity_counters,
-                can_roll_legendary,
-                can_roll_mythical,
-            ) = await calculate_hunt_probabilities(self.db, user.id, current_streak)
-            outcomes = [
-                "nothing",
-                "common",
-                "silver",
-                "gold",
-                "shiny",
-                "legendary",
-                "mythical",
-            ]
-            weights = [adjusted_chances[outcome] for outcome in outcomes]
-            result = random.choices(outcomes, weights=weights, k=1)[0]
-            if can_roll_mythical and pity_counters.get("mythical", 0) >= 500:
-                result = "mythical"
-            elif can_roll_legendary and pity_counters.get("legendary", 0) >= 150:
-                result = "legendary"
-            elif pity_counters.get("shiny", 0) >= 150:
-                result = "shiny"
-            elif pity_counters.get("gold", 0) >= 75:
-                result = "gold"
-            elif pity_counters.get("silver", 0) >= 50:
-                result = "silver"
-
-            embed = await process_hunt_outcome(
-                self.db,
-                user.id,
-                result,
-                pity_counters,
-                can_roll_legendary,
-                can_roll_mythical,
-            )
+            async with self.db.transaction():
+                row = await self.db.get_user_row(user.id)
+                current_streak = await update_hunt_streak(self.db, row, current_time)
+                (
+                    adjusted_chances,
+                    pity_counters,
+                    can_roll_legendary,
+                    can_roll_mythical,
+                ) = calculate_hunt_probabilities(row, current_streak)
+                outcomes = [
+                    "nothing",
+                    "common",
+                    "silver",
+                    "gold",
+                    "shiny",
+                    "legendary",
+                    "mythical",
+                ]
+                weights = [adjusted_chances[outcome] for outcome in outcomes]
+                result = random.choices(outcomes, weights=weights, k=1)[0]
+                if can_roll_mythical and pity_counters.get("mythical", 0) >= 500:
+                    result = "mythical"
+                elif can_roll_legendary and pity_counters.get("legendary", 0) >= 150:
+                    result = "legendary"
+                elif pity_counters.get("shiny", 0) >= 150:
+                    result = "shiny"
+                elif pity_counters.get("gold", 0) >= 75:
+                    result = "gold"
+                elif pity_counters.get("silver", 0) >= 50:
+                    result = "silver"
+
+                embed = await process_hunt_outcome(
+                    self.db,
+                    row,
+                    result,
+                    pity_counters,
+                    can_roll_legendary,
+                    can_roll_mythical,
+                )
+                await self.db.update_user(
+                    user.id,
+                    last_hunt=current_time,
+                    last_hunt_time=current_time,
+                    active_hunt=False,
+                )
+            finished = True
             embed.set_footer(text=f"Hunt Streak: {current_streak}")
 
             await ctx.send(
                 embed=embed, reference=ctx.message.to_reference(fail_if_not_exists=False)
             )
 
-            await self.db.set_user_field(user.id, "last_hunt", current_time)
-            await self.db.set_user_field(user.id, "last_hunt_time", current_time)
-
         finally:
-            await self.db.set_user_field(user.id, "active_hunt", False)
+            if not finished:
+                await self.db.set_user_field(user.id, "active_hunt", False)
             if event_task:
                 event_task.cancel()
 
@@ -199,9 +208,10 @@ class UserCommands(commands.Cog):
     async def progress(self, ctx: commands.Context):
         """Check your Easter Hunt progress!"""
         user = ctx.author
-        pity_counters = await self.db.get_pity_counters(user.id)
-        streak = await self.db.get_user_field(user.id, "hunt_streak")
-        eggs = await self.db.get_eggs(user.id)
+        row = await self.db.get_user_row(user.id)
+        pity_counters = row["pity_counters"]
+        streak = row["hunt_streak"]
+        eggs = row["eggs"]
 
         can_roll_legendary = (
             eggs.get("silver", 0) >= 20 and eggs.get("gold", 0) >= 10 and eggs.get("shiny", 0) >= 1
@@ -249,9 +259,10 @@ class UserCommands(commands.Cog):
                 mention_author=False,
             )
 
-        shards = await self.db.get_user_field(member.id, "shards")
-        eggs = await self.db.get_eggs(member.id)
-        gems = await self.db.get_user_field(member.id, "gems")
+        row = await self.db.get_user_row(member.id)
+        shards = row["shards"]
+        eggs = row["eggs"]
+        gems = row["gems"]
 
         embed = discord.Embed(
             title=f"{member.name}'s Easter Stash 🐰",
@@ -291,34 +302,44 @@ class UserCommands(commands.Cog):
         """
         if member is None:
             member = ctx.author
-        eggs = await self.db.get_eggs(member.id)
-        user_achievements = await self.db.get_achievements(member.id)
-        shards = await self.db.get_user_field(member.id, "shards")
-        gems = await self.db.get_user_field(member.id, "gems")
-        if member == ctx.author:
-            for achievement in achievements:
-                if achievement["condition_type"] == "egg":
-                    condition = (
-                        eggs.get(achievement["condition_key"], 0) >= achievement["condition_value"]
-                    )
-                elif achievement["condition_type"] == "streak":
-                    streak = await self.db.get_user_field(member.id, "hunt_streak")
-                    condition = streak >= achievement["condition_value"]
-                elif achievement["condition_type"] == "gems":
-                    condition = gems >= achievement["condition_value"]
-                else:
-                    condition = False
-
-                if condition and not user_achievements.get(achievement["key"], False):
-                    new_shards = shards + achievement["reward"]
-                    await self.db.set_user_field(member.id, "shards", new_shards)
-                    user_achievements[achievement["key"]] = True
-                    await self.db.set_achievements(member.id, user_achievements)
-                    await ctx.send(
-                        f"🎉 Congratulations {member.mention}! You've unlocked the **{achievement['name']}** achievement "
-                        f"and received {achievement['reward']} egg shards!"
-                    )
-                    shards = new_shards
+        # Unlocking reads and writes the row in one transaction so no shards are lost to a
+        # concurrent shift or trade.
+        unlocked = []
+        async with self.db.transaction():
+            row = await self.db.get_user_row(member.id)
+            eggs = row["eggs"]
+            user_achievements = row["achievements"]
+            gems = row["gems"]
+            streak = row["hunt_streak"]
+            if member == ctx.author:
+                for achievement in achievements:
+                    if achievement["condition_type"] == "egg":
+                        condition = (
+                            eggs.get(achievement["condition_key"], 0)
+                            >= achievement["condition_value"]
+                        )
+                    elif achievement["condition_type"] == "streak":
+                        condition = streak >= achievement["condition_value"]
+                    elif achievement["condition_type"] == "gems":
+                        condition = gems >= achievement["condition_value"]
+                    else:
+                        condition = False
+
+                    if condition and not user_achievements.get(achievement["key"], False):
+                        user_achievements[achievement["key"]] = True
+                        unlocked.append(achievement)
+
+            if unlocked:
+                reward = sum(achievement["reward"] for achievement in unlocked)
+                await self.db.update_user(member.id, shards=row["shards"] + reward)
+                await self.db.set_achievements(member.id, user_achievements)
+
+        if unlocked:
+            for achievement in unlocked:
+                await ctx.send(
+                    f"🎉 Congratulations {member.mention}! You've unlocked the **{achievement['name']}** achievement "
+                    f"and received {achievement['reward']} egg shards!"
+                )
 
         embed = discord.Embed(
             title="Easter Hunt Achievements",
@@ -332,7 +353,6 @@ class UserCommands(commands.Cog):
                     eggs.get(achievement["condition_key"], 0) >= achievement["condition_value"]
                 )
             elif achievement["condition_type"] == "streak":
-                streak = await self.db.get_user_field(member.id, "hunt_streak")
                 condition = streak >= achievement["condition_value"]
             elif achievement["condition_type"] == "gems":
                 condition = gems >= achievement["condition_value"]
@@ -360,9 +380,20 @@ class UserCommands(commands.Cog):
         The amount of shards you get is from 5 to 140, it's all random of what you get.
         """
         user = ctx.author
-        last_daily = await self.db.get_user_field(user.id, "last_daily")
         current_time = time.time()
-        cooldown_remaining = 43200 - (current_time - last_daily)
+        shards = random.randint(5, 140)
+        found_gem = random.random() < 0.05
+        # Read and write in one transaction so two claims at once cannot both pay out.
+        async with self.db.transaction():
+            row = await self.db.get_user_row(user.id)
+            cooldown_remaining = 43200 - (current_time - row["last_daily"])
+            if cooldown_remaining <= 0:
+                await self.db.update_user(
+                    user.id,
+                    shards=row["shards"] + shards,
+                    gems=row["gems"] + found_gem,
+                    last_daily=current_time,
+                )
         if cooldown_remaining > 0:
             cooldown_end = int(current_time + cooldown_remaining)
             return await ctx.send(
@@ -371,21 +402,15 @@ class UserCommands(commands.Cog):
                 mention_author=False,
             )
 
-        shards = random.randint(5, 140)
-        if random.random() < 0.05:
-            gems = await self.db.get_user_field(user.id, "gems")
-            await self.db.set_user_field(user.id, "gems", gems + 1)
+        if found_gem:
             await ctx.send("You found a hidden gem in your daily gift! 💎")
 
         end_time = int((datetime.now() + timedelta(hours=12)).timestamp())
-        current_shards = await self.db.get_user_field(user.id, "shards")
-        await self.db.set_user_field(user.id, "shards", current_shards + shards)
         await ctx.send(
             f"The Easter Bunny hops by and drops {shards} Egg Shards in your basket! Egg-citing, right? Come back <t:{end_time}:R> for another yolky surprise!",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
             mention_author=False,
         )
-        await self.db.set_user_field(user.id, "last_daily", current_time)
 
     @easterhunt.command()
     @commands.bot_has_permissions(embed_links=True)
@@ -421,7 +446,8 @@ class UserCommands(commands.Cog):
                 reference=ctx.message.to_reference(fail_if_not_exists=False),
             )
 
-        last_give = await self.db.get_user_field(giver.id, "last_give")
+        giver_row = await self.db.get_user_row(giver.id)
+        last_give = giver_row["last_give"]
         current_time = time.time()
         cooldown_remaining = 5 - (current_time - last_give)
         if cooldown_remaining > 0:
@@ -446,7 +472,7 @@ class UserCommands(commands.Cog):
                 mention_author=False,
             )
 
-        giver_count = await self.db.get_egg_count(giver.id, egg_type)
+        giver_count = giver_row["eggs"][egg_type]
         if giver_count < amount:
             return await ctx.send(
                 f"You don’t have enough {egg_type.capitalize()} Eggs to give! "
@@ -455,17 +481,25 @@ class UserCommands(commands.Cog):
                 mention_author=False,
             )
 
-        await self.db.set_egg_count(giver.id, egg_type, giver_count - amount)
-        receiver_count = await self.db.get_egg_count(member.id, egg_type)
-        await self.db.set_egg_count(member.id, egg_type, receiver_count + amount)
+        async with self.db.transaction():
+            given = await self.db.add_eggs(giver.id, {egg_type: -amount})
+            if given:
+                await self.db.add_eggs(member.id, {egg_type: amount})
+                await self.db.update_user(giver.id, last_give=current_time)
+        if not given:
+            return await ctx.send(
+                f"You don’t have enough {egg_type.capitalize()} Eggs to give! 🥚",
+                reference=ctx.message.to_reference(fail_if_not_exists=False),
+                mention_author=False,
+            )
 
-        await self.db.set_user_field(giver.id, "last_give", current_time)
+        receiver_count = (await self.db.get_user_row(member.id))["eggs"][egg_type]
         embed = discord.Embed(
             title="Egg Gift 🎁",
             color=await ctx.embed_color(),
             description=(
                 f"{giver.mention} has given {amount} {egg_type.capitalize()} Egg(s) to {member.mention}! 🥚\n"
-                f"{member.mention} now has {receiver_count + amount} {egg_type.capitalize()} Egg(s)."
+                f"{member.mention} now has {receiver_count} {egg_type.capitalize()} Egg(s)."
             ),
         )
         await ctx.send(
@@ -484,7 +518,12 @@ class UserCommands(commands.Cog):
         if amount <= 0:
             return await ctx.send("Please enter a positive number of shards to trade!")
 
-        current_shards = await self.db.get_user_field(ctx.author.id, "shards")
+        # Shards are taken before credits are paid, so two trades at once cannot both
+        # spend the same shards; they are handed back if the deposit is refused.
+        async with self.db.transaction():
+            current_shards = (await self.db.get_user_row(ctx.author.id))["shards"]
+            if current_shards >= amount:
+                await self.db.update_user(ctx.author.id, shards=current_shards - amount)
         if current_shards < amount:
             return await ctx.send(
                 f"You don't have enough shards! You currently have {current_shards} shards.",
@@ -492,17 +531,17 @@ class UserCommands(commands.Cog):
             )
 
         credit = amount * 20
-        new_shard_amount = current_shards - amount
-
         currency_name = await bank.get_currency_name(ctx.guild)
         try:
             await bank.deposit_credits(ctx.author, credit)
         except errors.BalanceTooHigh:
+            async with self.db.transaction():
+                current_shards = (await self.db.get_user_row(ctx.author.id))["shards"]
+                await self.db.update_user(ctx.author.id, shards=current_shards + amount)
             return await ctx.send(
                 f"Your {currency_name} balance is too high to accept more credits! No shards were deducted.",
                 reference=ctx.message.to_reference(fail_if_not_exists=False),
             )
-        await self.db.set_user_field(ctx.author.id, "shards", new_shard_amount)
         await ctx.send(
             f"Successfully traded {humanize_number(amount)} shards for {humanize_number(credit)} {currency_name}!",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -520,21 +559,22 @@ class UserCommands(commands.Cog):
         if amount <= 0:
             return await ctx.send("Please enter a positive number of gems to sell!")
 
-        current_gems = await self.db.get_user_field(ctx.author.id, "gems")
+        shards_earned = amount * 500
+        async with self.db.transaction():
+            row = await self.db.get_user_row(ctx.author.id)
+            current_gems = row["gems"]
+            if current_gems >= amount:
+                await self.db.update_user(
+                    ctx.author.id,
+                    gems=current_gems - amount,
+                    shards=row["shards"] + shards_earned,
+                )
         if current_gems < amount:
             return await ctx.send(
                 f"You don't have enough hidden gems! You currently have {current_gems} gems.",
                 reference=ctx.message.to_reference(fail_if_not_exists=False),
             )
 
-        shards_earned = amount * 500
-        new_gem_amount = current_gems - amount
-
-        current_shards = await self.db.get_user_field(ctx.author.id, "shards")
-        new_shard_amount = current_shards + shards_earned
-
-        await self.db.set_user_field(ctx.author.id, "gems", new_gem_amount)
-        await self.db.set_user_field(ctx.author.id, "shards", new_shard_amount)
         await ctx.send(
             f"Successfully sold {humanize_number(amount)} hidden gem(s) for {humanize_number(shards_earned)} egg shards!",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -548,11 +588,12 @@ class UserCommands(commands.Cog):
         """
         Reset your own Easter hunt data (eggs, shards, pity counters, etc.).
         """
-        shards = await self.db.get_user_field(ctx.author.id, "shards")
-        eggs = await self.db.get_eggs(ctx.author.id)
-        pity = await self.db.get_pity_counters(ctx.author.id)
-        ach = await self.db.get_achievements(ctx.author.id)
-        gems = await self.db.get_user_field(ctx.author.id, "gems")
+        row = await self.db.get_user_row(ctx.author.id)
+        shards = row["shards"]
+        eggs = row["eggs"]
+        pity = row["pity_counters"]
+        ach = row["achievements"]
+        gems = row["gems"]
         if not any(eggs.values()) and shards == 0 and not pity and not ach and gems == 0:
             return await ctx.send(
                 "You don't have any data to reset!",
@@ -591,12 +632,21 @@ class UserCommands(commands.Cog):
         Shiny, Legendary, and Mythical Eggs are special achievement eggs and are not included.
         """
         guild = ctx.guild
-        leaderboard_data = await self.db.get_leaderboard_data()
-        filtered_data = []
-        for user_id, total_eggs in leaderboard_data:
-            member = guild.get_member(user_id)
-            if member:
-                filtered_data.append((member, total_eggs))
+        totals = await self.db.get_leaderboard_totals([member.id for member in guild.members])
+        filtered_data = [
+            (member, total_eggs)
+            for user_id, total_eggs in totals
+            if (member := guild.get_member(user_id))
+        ]
+        author_rank = next(
+            (
+                rank
+                for rank, (member, _) in enumerate(filtered_data, start=1)
+                if member == ctx.author
+            ),
+            None,
+        )
+        global_rank = await self.db.get_global_rank(ctx.author.id)
 
         if not filtered_data:
             return await ctx.send(
@@ -618,6 +668,11 @@ class UserCommands(commands.Cog):
                     value=f"{humanize_number(total_eggs)} Eggs",
                     inline=False,
                 )
+            if author_rank is not None:
+                embed.set_footer(
+                    text=f"Your rank: #{humanize_number(author_rank)} "
+                    f"(#{humanize_number(global_rank)} globally)"
+                )
             pages.append(embed)
         await SimpleMenu(pages, disable_after_timeout=True, timeout=120).start(ctx)
 
@@ -631,17 +686,18 @@ class UserCommands(commands.Cog):
         You're lucky if you find a hidden gem while working too, those can be sold for shards that you can trade in for currency.
         """
         user = ctx.author
-        if await self.db.get_user_field(user.id, "active_work"):
+        row = await self.db.get_user_row(user.id)
+        if row["active_work"]:
             return await ctx.send(
                 f"{user.mention}, you’re already on the job! Finish your shift first!"
             )
 
-        if await self.db.get_user_field(user.id, "active_hunt"):
+        if row["active_hunt"]:
             return await ctx.send(
                 f"{user.mention}, wait until you finish your active hunting before you can work!"
             )
 
-        last_work = await self.db.get_user_field(user.id, "last_work")
+        last_work = row["last_work"]
         current_time = time.time()
         cooldown_remaining = 300 - (current_time - last_work)
         if cooldown_remaining > 0:
@@ -663,111 +719,83 @@ class UserCommands(commands.Cog):
                 )
         try:
             work_ends = time.time() + 300
-            await self.db.set_user_field(user.id, "active_work", True)
-            await self.db.set_user_field(user.id, "last_work", work_ends)
-            await self.db.set_user_field(user.id, "active_job_type", job_type)
+            async with self.db.transaction():
+                await self.db.update_user(
+                    user.id, active_work=True, last_work=work_ends, active_job_type=job_type
+                )
+                await self.db.schedule_job(
+                    user.id, job_type, work_ends, interaction.guild_id, interaction.channel_id
+                )
+            self.wake_job_runner()
             await interaction.response.send_message(
                 f"{user.mention} starts working as a {job_type.replace('_', ' ').title()}! Shift begins... 🐰💼\nYou finish your shift <t:{int(work_ends)}:R>"
             )
-
-            self.active_tasks[user.id] = self.bot.loop.create_task(
-                self.run_job(interaction, job_type, user, work_ends)
-            )
         except discord.HTTPException as e:
             log.error(f"Error starting job for {user}: {e}")
             with contextlib.suppress(discord.HTTPException):
                 await interaction.channel.send(
                     f"{user.mention}, something went wrong starting your shift! It has been cancelled."
                 )
-            await self.db.set_user_field(user.id, "active_work", False)
-            await self.db.set_user_field(user.id, "last_work", 0)
-            await self.db.set_user_field(user.id, "active_job_type", None)
-            if user.id in self.active_tasks:
-                del self.active_tasks[user.id]
+            async with self.db.transaction():
+                await self.db.delete_job(user.id)
+                await self.db.update_user(
+                    user.id, active_work=False, last_work=0, active_job_type=None
+                )
 
     async def _execute_job_outcome(self, user_id: int, job_type: str, guild) -> str:
         """Execute job outcome logic and return a result message string."""
+        row = await self.db.get_user_row(user_id)
         if job_type == "stealer":
             if random.random() < 0.3 and guild is not None:
                 target, stolen_egg_type = await self.db.find_target_player(user_id, guild)
+                stolen = False
                 if target and stolen_egg_type:
-                    target_count = await self.db.get_egg_count(target.id, stolen_egg_type)
-                    user_count = await self.db.get_egg_count(user_id, stolen_egg_type)
-                    await self.db.set_egg_count(
-                        target.id, stolen_egg_type, max(0, target_count - 1)
-                    )
-                    await self.db.set_egg_count(user_id, stolen_egg_type, user_count + 1)
+                    async with self.db.transaction():
+                        stolen = await self.db.add_eggs(target.id, {stolen_egg_type: -1})
+                        if stolen:
+                            await self.db.add_eggs(user_id, {stolen_egg_type: 1})
+                if stolen:
                     return f"sneaks back from stealing! You nabbed a **{stolen_egg_type.title()} Egg** from {target.name}! 🕵️"
                 else:
                     return "couldn't find anyone to steal from! Better luck next shift."
             else:
                 if random.random() < 0.6:
                     egg_type = random.choice(["common", "silver"])
-                    user_count = await self.db.get_egg_count(user_id, egg_type)
-                    await self.db.set_egg_count(user_id, egg_type, user_count + 1)
+                    await self.db.add_eggs(user_id, {egg_type: 1})
                     return f"nabbed a **{egg_type.title()} Egg** from a distracted bunny! 🐇"
                 else:
                     return "got caught red-handed by an angry bunny! No eggs—better luck next shift! 🐰"
 
         elif job_type == "store_clerk":
             shards = random.randint(5, 25)
-            current_shards = await self.db.get_user_field(user_id, "shards")
-            await self.db.set_user_field(user_id, "shards", current_shards + shards)
+            await self.db.set_user_field(user_id, "shards", row["shards"] + shards)
             return f"finished a shift at the Egg Emporium! Earned **{shards} Egg Shards**—nice hustle! 🏪"
 
         elif job_type == "egg_giver":
             shards = random.randint(3, 25)
-            current_shards = await self.db.get_user_field(user_id, "shards")
-            await self.db.set_user_field(user_id, "shards", current_shards + shards)
+            await self.db.set_user_field(user_id, "shards", row["shards"] + shards)
             return f"hopped around giving out eggs! The bunnies loved it—earned **{shards} Egg Shards**! 🥚"
 
         elif job_type == "egg_painter":
             egg_type = random.choice(["common", "silver"])
             amount = random.randint(1, 25) if egg_type == "common" else 1
-            user_count = await self.db.get_egg_count(user_id, egg_type)
-            await self.db.set_egg_count(user_id, egg_type, user_count + amount)
+            await self.db.add_eggs(user_id, {egg_type: amount})
             result = f"finished painting eggs! Created **{amount} {egg_type.title()} Egg(s)**! 🎨"
             if random.random() < 0.1:
-                gems = await self.db.get_user_field(user_id, "gems")
-                await self.db.set_user_field(user_id, "gems", gems + 1)
+                await self.db.set_user_field(user_id, "gems", row["gems"] + 1)
                 result += " Also found a **hidden gem** while painting! 💎"
             return result
 
         elif job_type == "gem_miner":
             if random.random() < 0.4:
-                gems = await self.db.get_user_field(user_id, "gems")
-                await self.db.set_user_field(user_id, "gems", gems + 1)
+                await self.db.set_user_field(user_id, "gems", row["gems"] + 1)
                 return "mined a **hidden gem**! 💎"
             else:
                 if random.random() < 0.5:
                     shards = random.randint(1, 25)
-                    current_shards = await self.db.get_user_field(user_id, "shards")
-                    await self.db.set_user_field(user_id, "shards", current_shards + shards)
+                    await self.db.set_user_field(user_id, "shards", row["shards"] + shards)
                     return f"found **{shards} shards** while mining."
                 else:
                     return "dug around but found nothing this time. 🪨"
 
         return "finished their shift."
-
-    async def run_job(self, interaction, job_type, user, work_ends):
-        try:
-            await asyncio.sleep(300)
-            result_message = await self._execute_job_outcome(user.id, job_type, interaction.guild)
-            try:
-                await interaction.channel.send(f"{user.mention} {result_message}")
-            except discord.HTTPException as e:
-                log.error(f"Failed to send job result message for {user}: {e}")
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            log.error(f"Unexpected error in run_job for {user}: {e}")
-            with contextlib.suppress(discord.HTTPException):
-                await interaction.channel.send(
-                    f"{user.mention}, something went wrong during your shift! It has been cancelled."
-                )
-        finally:
-            await self.db.set_user_field(user.id, "active_work", False)
-            await self.db.set_user_field(user.id, "last_work", 0)
-            await self.db.set_user_field(user.id, "active_job_type", None)
-            if user.id in self.active_tasks:
-                del self.active_tasks[user.id]
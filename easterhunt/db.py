@@ -22,9 +22,14 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import contextlib
 import json
 import random
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
 
 import aiosqlite
 import discord
@@ -32,22 +37,80 @@ import orjson
 from redbot.core.data_manager import cog_data_path
 
 
+EGG_TYPES = ("common", "silver", "gold", "shiny", "legendary", "mythical")
+LEADERBOARD_EGG_TYPES = ("common", "silver", "gold")
+ROW_CACHE_SIZE = 512
+# Users looked up per query when building a guild leaderboard.
+LEADERBOARD_CHUNK_SIZE = 500
+
+# WAL lets readers such as the leaderboard run alongside writers, and NORMAL sync
+# only fsyncs at checkpoints, which is safe in WAL mode.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 67108864",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
 class Database:
-    def __init__(self, bot):
+    def __init__(self, bot, db_path: Path | None = None):
         self.bot = bot
-        self.data_path = cog_data_path(raw_name="EasterHunt")
-        self.db_path = self.data_path / "easterhunt.db"
+        if db_path is None:
+            self.data_path = cog_data_path(raw_name="EasterHunt")
+            db_path = self.data_path / "easterhunt.db"
+        else:
+            self.data_path = db_path.parent
+        self.db_path = db_path
         self.conn = None
+        # user_id -> row from `get_user_row`, least recently used first.
+        self._row_cache: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        # Every write runs inside `transaction`, one task at a time, on the shared connection.
+        self._write_lock = asyncio.Lock()
+        self._transaction_owner: asyncio.Task | None = None
+        self._transaction_users: set[int] = set()
 
     async def initialize(self):
         self.conn = await aiosqlite.connect(self.db_path)
-        await self.conn.execute("PRAGMA foreign_keys = ON")
+        await self.apply_pragmas()
         await self.create_tables()
 
+    async def apply_pragmas(self):
+        for pragma in PRAGMAS:
+            await self.conn.execute(pragma)
+
     async def close(self):
         if self.conn:
+            with contextlib.suppress(aiosqlite.Error):
+                await self.conn.execute("PRAGMA optimize")
             await self.conn.close()
 
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group writes so they are committed once, or rolled back together on error.
+
+        Nested use from the same task joins the outer transaction.
+        """
+        if self._transaction_owner is asyncio.current_task():
+            yield
+            return
+        async with self._write_lock:
+            self._transaction_owner = asyncio.current_task()
+            try:
+                yield
+            except BaseException:
+                await self.conn.rollback()
+                raise
+            else:
+                await self.conn.commit()
+            finally:
+                self._transaction_owner = None
+                for user_id in self._transaction_users:
+                    self._row_cache.pop(user_id, None)
+                self._transaction_users.clear()
+
     async def create_tables(self):
         queries = [
             """CREATE TABLE IF NOT EXISTS users (
@@ -73,89 +136,199 @@ class Database:
                 PRIMARY KEY (user_id, egg_type),
                 FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
             )""",
+            """CREATE TABLE IF NOT EXISTS user_totals (
+                user_id INTEGER PRIMARY KEY,
+                total INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
+            )""",
+            """CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                user_id INTEGER PRIMARY KEY,
+                job_type TEXT NOT NULL,
+                due REAL NOT NULL,
+                guild_id INTEGER,
+                channel_id INTEGER,
+                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
+            )""",
             """CREATE TABLE IF NOT EXISTS egg_images (
                 egg_type TEXT PRIMARY KEY,
                 image_url TEXT
             )""",
+            "CREATE INDEX IF NOT EXISTS idx_user_eggs_user_count ON user_eggs (user_id, count)",
+            "CREATE INDEX IF NOT EXISTS idx_user_eggs_egg_type ON user_eggs (egg_type, count)",
+            """CREATE INDEX IF NOT EXISTS idx_users_active_work
+                ON users (active_work) WHERE active_work = 1""",
+            "CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_due ON scheduled_jobs (due)",
+            "CREATE INDEX IF NOT EXISTS idx_user_totals_total ON user_totals (total DESC, user_id)",
+            # `user_totals` holds each user's leaderboard total (common, silver and gold eggs).
+            # The triggers keep it in step with `user_eggs` inside the writing transaction.
+            f"""CREATE TRIGGER IF NOT EXISTS trg_user_eggs_insert AFTER INSERT ON user_eggs
+                WHEN NEW.egg_type IN {LEADERBOARD_EGG_TYPES}
+                BEGIN
+                    INSERT INTO user_totals (user_id, total) VALUES (NEW.user_id, NEW.count)
+                    ON CONFLICT (user_id) DO UPDATE SET total = total + excluded.total;
+                END""",
+            f"""CREATE TRIGGER IF NOT EXISTS trg_user_eggs_update AFTER UPDATE OF count ON user_eggs
+                WHEN NEW.egg_type IN {LEADERBOARD_EGG_TYPES}
+                BEGIN
+                    UPDATE user_totals SET total = total + NEW.count - OLD.count
+                    WHERE user_id = NEW.user_id;
+                END""",
+            f"""CREATE TRIGGER IF NOT EXISTS trg_user_eggs_delete AFTER DELETE ON user_eggs
+                WHEN OLD.egg_type IN {LEADERBOARD_EGG_TYPES}
+                BEGIN
+                    UPDATE user_totals SET total = total - OLD.count WHERE user_id = OLD.user_id;
+                END""",
         ]
         async with self.conn.cursor() as cursor:
+            await cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'user_totals'"
+            )
+            backfill_totals = await cursor.fetchone() is None
             for query in queries:
                 await cursor.execute(query)
+            if backfill_totals:
+                await cursor.execute(
+                    f"""
+                    INSERT INTO user_totals (user_id, total)
+                    SELECT user_id, SUM(count)
+                    FROM user_eggs
+                    WHERE egg_type IN {LEADERBOARD_EGG_TYPES}
+                    GROUP BY user_id
+                    """
+                )
             with contextlib.suppress(Exception):
                 await cursor.execute(
                     "ALTER TABLE users ADD COLUMN active_job_type TEXT DEFAULT NULL"
                 )
             await self.conn.commit()
 
+    async def get_user_row(self, user_id: int) -> dict[str, Any]:
+        """Return the user's `users` row with their eggs, creating the row if needed.
+
+        The row also carries the decoded ``eggs``, ``pity_counters`` and ``achievements``.
+        Rows are kept in a small LRU cache that every write for the user invalidates,
+        and each call returns a copy that is safe to modify.
+        """
+        row = self._row_cache.get(user_id)
+        if row is None:
+            row = await self._fetch_user_row(user_id)
+            self._row_cache[user_id] = row
+            if len(self._row_cache) > ROW_CACHE_SIZE:
+                self._row_cache.popitem(last=False)
+        else:
+            self._row_cache.move_to_end(user_id)
+        return {
+            **row,
+            "eggs": dict(row["eggs"]),
+            "pity_counters": dict(row["pity_counters"]),
+            "achievements": dict(row["achievements"]),
+        }
+
+    async def _fetch_user_row(self, user_id: int) -> dict[str, Any]:
+        async with self.transaction(), self.conn.cursor() as cursor:
+            await cursor.execute(
+                "INSERT INTO users (user_id) VALUES (?) ON CONFLICT (user_id) DO NOTHING",
+                (user_id,),
+            )
+            await cursor.execute(
+                """
+                SELECT users.*, user_eggs.egg_type, user_eggs.count
+                FROM users
+                LEFT JOIN user_eggs ON user_eggs.user_id = users.user_id
+                WHERE users.user_id = ?
+                """,
+                (user_id,),
+            )
+            rows = await cursor.fetchall()
+            columns = [column[0] for column in cursor.description][:-2]
+
+        row = dict(zip(columns, rows[0][:-2], strict=True))
+        eggs = dict.fromkeys(EGG_TYPES, 0)
+        eggs.update({egg_type: count for *_, egg_type, count in rows if egg_type is not None})
+        row["eggs"] = eggs
+        row["pity_counters"] = orjson.loads(row["pity_counter_json"])
+        row["achievements"] = orjson.loads(row["achievements_json"])
+        return row
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._row_cache.pop(user_id, None)
+        if self._transaction_owner is not None:
+            self._transaction_users.add(user_id)
+
     async def ensure_user(self, user_id: int):
-        async with self.conn.cursor() as cursor:
-            await cursor.execute("SELECT 1 FROM users WHERE user_id = ?", (user_id,))
-            if not await cursor.fetchone():
-                await cursor.execute("INSERT INTO users (user_id) VALUES (?)", (user_id,))
-                await self.conn.commit()
+        await self.get_user_row(user_id)
 
     async def get_user_field(self, user_id: int, field: str):
-        await self.ensure_user(user_id)
-        async with self.conn.cursor() as cursor:
-            await cursor.execute(f"SELECT {field} FROM users WHERE user_id = ?", (user_id,))
-            return (await cursor.fetchone())[0]
+        return (await self.get_user_row(user_id))[field]
 
     async def set_user_field(self, user_id: int, field: str, value):
-        if field in ["active_hunt", "active_work"]:
-            value = 1 if value else 0
-        async with self.conn.cursor() as cursor:
+        await self.update_user(user_id, **{field: value})
+
+    async def update_user(self, user_id: int, **fields):
+        """Set several `users` columns for a user in a single statement."""
+        if not fields:
+            return
+        for field in ("active_hunt", "active_work"):
+            if field in fields:
+                fields[field] = 1 if fields[field] else 0
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        async with self.transaction(), self.conn.cursor() as cursor:
             await cursor.execute(
-                f"UPDATE users SET {field} = ? WHERE user_id = ?",
-                (value, user_id),
+                "INSERT INTO users (user_id) VALUES (?) ON CONFLICT (user_id) DO NOTHING",
+                (user_id,),
             )
-        await self.conn.commit()
-
-    async def get_eggs(self, user_id: int) -> dict[str, int]:
-        await self.ensure_user(user_id)
-        async with self.conn.cursor() as cursor:
             await cursor.execute(
-                "SELECT egg_type, count FROM user_eggs WHERE user_id = ?", (user_id,)
+                f"UPDATE users SET {assignments} WHERE user_id = ?",
+                (*fields.values(), user_id),
             )
-            rows = await cursor.fetchall()
-            eggs = {
-                "common": 0,
-                "silver": 0,
-                "gold": 0,
-                "shiny": 0,
-                "legendary": 0,
-                "mythical": 0,
-            }
-            eggs.update(dict(rows))
-            return eggs
+            self.invalidate_user(user_id)
+
+    async def get_eggs(self, user_id: int) -> dict[str, int]:
+        return (await self.get_user_row(user_id))["eggs"]
 
     async def get_egg_count(self, user_id: int, egg_type: str) -> int:
-        await self.ensure_user(user_id)
-        async with self.conn.cursor() as cursor:
-            await cursor.execute(
-                "SELECT count FROM user_eggs WHERE user_id = ? AND egg_type = ?",
-                (user_id, egg_type),
-            )
-            row = await cursor.fetchone()
-            return row[0] if row else 0
+        return (await self.get_user_row(user_id))["eggs"].get(egg_type, 0)
 
     async def set_egg_count(self, user_id: int, egg_type: str, value: int):
-        async with self.conn.cursor() as cursor:
+        async with self.transaction(), self.conn.cursor() as cursor:
             await cursor.execute(
-                "INSERT OR REPLACE INTO user_eggs (user_id, egg_type, count) VALUES (?, ?, ?)",
+                """
+                INSERT INTO user_eggs (user_id, egg_type, count) VALUES (?, ?, ?)
+                ON CONFLICT (user_id, egg_type) DO UPDATE SET count = excluded.count
+                """,
                 (user_id, egg_type, value),
             )
-        await self.conn.commit()
+            self.invalidate_user(user_id)
+
+    async def add_eggs(self, user_id: int, deltas: dict[str, int]) -> bool:
+        """Add eggs per type, or remove them with negative amounts.
+
+        Nothing is written and ``False`` is returned if a removal would take a
+        count below zero. The check and the write happen under the write lock,
+        so concurrent gives and steals cannot both spend the same eggs.
+        """
+        async with self.transaction():
+            eggs = (await self.get_user_row(user_id))["eggs"]
+            if any(eggs.get(egg_type, 0) + delta < 0 for egg_type, delta in deltas.items()):
+                return False
+            await self.conn.executemany(
+                """
+                INSERT INTO user_eggs (user_id, egg_type, count) VALUES (?, ?, ?)
+                ON CONFLICT (user_id, egg_type) DO UPDATE SET count = count + excluded.count
+                """,
+                [(user_id, egg_type, delta) for egg_type, delta in deltas.items() if delta],
+            )
+            self.invalidate_user(user_id)
+        return True
 
     async def get_pity_counters(self, user_id: int) -> dict[str, int]:
-        json_str = await self.get_user_field(user_id, "pity_counter_json")
-        return orjson.loads(json_str)
+        return (await self.get_user_row(user_id))["pity_counters"]
 
     async def set_pity_counters(self, user_id: int, data: dict[str, int]):
         await self.set_user_field(user_id, "pity_counter_json", json.dumps(data))
 
     async def get_achievements(self, user_id: int) -> dict[str, bool]:
-        json_str = await self.get_user_field(user_id, "achievements_json")
-        return orjson.loads(json_str)
+        return (await self.get_user_row(user_id))["achievements"]
 
     async def set_achievements(self, user_id: int, data: dict[str, bool]):
         await self.set_user_field(user_id, "achievements_json", json.dumps(data))
@@ -167,7 +340,7 @@ class Database:
             return {row[0]: row[1] for row in rows if row[1] is not None}
 
     async def set_egg_image(self, egg_type: str, url: str | None):
-        async with self.conn.cursor() as cursor:
+        async with self.transaction(), self.conn.cursor() as cursor:
             if url is None:
                 await cursor.execute("DELETE FROM egg_images WHERE egg_type = ?", (egg_type,))
             else:
@@ -175,49 +348,142 @@ class Database:
                     "INSERT OR REPLACE INTO egg_images (egg_type, image_url) VALUES (?, ?)",
                     (egg_type, url),
                 )
-        await self.conn.commit()
 
     async def delete_user_data(self, user_id: int):
-        async with self.conn.cursor() as cursor:
+        async with self.transaction(), self.conn.cursor() as cursor:
             await cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
-        await self.conn.commit()
+            self.invalidate_user(user_id)
+
+    async def schedule_job(
+        self,
+        user_id: int,
+        job_type: str,
+        due: float,
+        guild_id: int | None = None,
+        channel_id: int | None = None,
+    ):
+        """Persist a work shift so the job runner finishes it at ``due``, even after a restart."""
+        async with self.transaction(), self.conn.cursor() as cursor:
+            await cursor.execute(
+                """
+                INSERT INTO scheduled_jobs (user_id, job_type, due, guild_id, channel_id)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (user_id) DO UPDATE SET
+                    job_type = excluded.job_type,
+                    due = excluded.due,
+                    guild_id = excluded.guild_id,
+                    channel_id = excluded.channel_id
+                """,
+                (user_id, job_type, due, guild_id, channel_id),
+            )
+
+    async def delete_job(self, user_id: int) -> bool:
+        """Remove the user's scheduled job, returning whether there was one to remove."""
+        async with self.transaction(), self.conn.cursor() as cursor:
+            await cursor.execute("DELETE FROM scheduled_jobs WHERE user_id = ?", (user_id,))
+            return cursor.rowcount > 0
+
+    async def postpone_job(self, user_id: int, due: float) -> bool:
+        """Move an existing job to ``due``, returning whether the user still had one."""
+        async with self.transaction(), self.conn.cursor() as cursor:
+            await cursor.execute(
+                "UPDATE scheduled_jobs SET due = ? WHERE user_id = ?", (due, user_id)
+            )
+            return cursor.rowcount > 0
 
-    async def get_stale_active_users(self) -> list[tuple[int, float]]:
+    async def get_due_jobs(
+        self, now: float, limit: int
+    ) -> list[tuple[int, str, int | None, int | None]]:
         async with self.conn.cursor() as cursor:
-            await cursor.execute("SELECT user_id, last_work FROM users WHERE active_work = 1")
+            await cursor.execute(
+                """
+                SELECT user_id, job_type, guild_id, channel_id
+                FROM scheduled_jobs
+                WHERE due <= ?
+                ORDER BY due
+                LIMIT ?
+                """,
+                (now, limit),
+            )
             return await cursor.fetchall()
 
+    async def get_next_job_due(self) -> float | None:
+        async with self.conn.cursor() as cursor:
+            await cursor.execute("SELECT MIN(due) FROM scheduled_jobs")
+            return (await cursor.fetchone())[0]
+
+    async def recover_jobs(self):
+        """Schedule shifts that were started before `scheduled_jobs` existed.
+
+        Workers without a job type cannot be finished and are reset instead.
+        """
+        async with self.transaction(), self.conn.cursor() as cursor:
+            await cursor.execute(
+                """
+                INSERT INTO scheduled_jobs (user_id, job_type, due)
+                SELECT user_id, active_job_type, last_work
+                FROM users
+                WHERE active_work = 1 AND active_job_type IS NOT NULL
+                ON CONFLICT (user_id) DO NOTHING
+                """
+            )
+            await cursor.execute(
+                """
+                UPDATE users SET active_work = 0, last_work = 0
+                WHERE active_work = 1 AND active_job_type IS NULL
+                """
+            )
+            self._row_cache.clear()
+
     async def get_user_count(self) -> int:
         async with self.conn.cursor() as cursor:
             await cursor.execute("SELECT COUNT(*) FROM users")
             return (await cursor.fetchone())[0]
 
     async def reset_all(self):
-        async with self.conn.cursor() as cursor:
+        async with self.transaction(), self.conn.cursor() as cursor:
             await cursor.execute("DELETE FROM user_eggs")
             await cursor.execute("DELETE FROM users")
             await cursor.execute("DELETE FROM egg_images")
-        await self.conn.commit()
+        self._row_cache.clear()
+
+    async def get_leaderboard_totals(self, user_ids: list[int]) -> list[tuple[int, int]]:
+        """Return ``(user_id, total)`` for the given users with eggs, highest total first.
 
-    async def get_leaderboard_data(self) -> list[tuple[int, int]]:
+        Looks the users up by primary key in chunks instead of walking the whole table.
+        """
+        totals = []
         async with self.conn.cursor() as cursor:
-            await cursor.execute(
-                """
-                SELECT user_id, SUM(count) as total
-                FROM user_eggs
-                WHERE egg_type IN ('common', 'silver', 'gold')
-                GROUP BY user_id
-                HAVING total > 0
-                ORDER BY total DESC
-                """
-            )
-            return await cursor.fetchall()
+            for start in range(0, len(user_ids), LEADERBOARD_CHUNK_SIZE):
+                chunk = user_ids[start : start + LEADERBOARD_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                await cursor.execute(
+                    f"SELECT user_id, total FROM user_totals "
+                    f"WHERE user_id IN ({placeholders}) AND total > 0",
+                    chunk,
+                )
+                totals.extend(await cursor.fetchall())
+        totals.sort(key=lambda row: (-row[1], row[0]))
+        return totals
+
+    async def get_global_rank(self, user_id: int) -> int | None:
+        """Return the user's 1-based rank across all players, or ``None`` without eggs."""
+        async with self.conn.cursor() as cursor:
+            await cursor.execute("SELECT total FROM user_totals WHERE user_id = ?", (user_id,))
+            row = await cursor.fetchone()
+            if row is None or row[0] <= 0:
+                return None
+            await cursor.execute("SELECT COUNT(*) FROM user_totals WHERE total > ?", (row[0],))
+            return (await cursor.fetchone())[0] + 1
 
     async def find_target_player(
         self, user_id: int, guild
     ) -> tuple[discord.Member | None, str | None]:
-        """Find a random guild member with eggs to steal from, excluding the requesting user."""
-        potential_targets = []
+        """Find a random guild member with eggs to steal from, excluding the requesting user.
+
+        Candidates come from one covering-index scan and are filtered against the guild's
+        member cache in memory; only the chosen target's eggs are queried.
+        """
         async with self.conn.cursor() as cursor:
             await cursor.execute(
                 """
@@ -228,18 +494,26 @@ class Database:
                 (user_id,),
             )
             rows = await cursor.fetchall()
-            for (target_id,) in rows:
-                member = guild.get_member(target_id)
-                if member and not member.bot:
-                    eggs = await self.get_eggs(member.id)
-                    potential_targets.append((member, eggs))
-
-        if not potential_targets:
-            return None, None
+            potential_targets = [
+                member
+                for (target_id,) in rows
+                if (member := guild.get_member(target_id)) and not member.bot
+            ]
+            if not potential_targets:
+                return None, None
 
-        target, target_eggs = random.choice(potential_targets)
-        available_egg_types = [egg_type for egg_type, count in target_eggs.items() if count > 0]
-        if not available_egg_types:
+            target = random.choice(potential_targets)
+            await cursor.execute(
+                """
+                SELECT egg_type
+                FROM user_eggs
+                WHERE user_id = ? AND count > 0
+                ORDER BY RANDOM()
+                LIMIT 1
+                """,
+                (target.id,),
+            )
+            row = await cursor.fetchone()
+        if row is None:
             return None, None
-        egg_type = random.choice(available_egg_types)
-        return target, egg_type
+        return target, row[0]
@@ -38,6 +38,12 @@ from .db import Database
 
 log = getLogger("red.maxcogs.easterhunt")
 
+JOB_BATCH_SIZE = 50
+# A shift that fails to finish is retried after JOB_RETRY_DELAY * attempts seconds,
+# and abandoned (the worker is freed without a result) after JOB_MAX_ATTEMPTS.
+JOB_RETRY_DELAY = 60
+JOB_MAX_ATTEMPTS = 5
+
 
 class EasterHunt(UserCommands, OwnerCommands, commands.Cog):
     """
@@ -53,7 +59,9 @@ class EasterHunt(UserCommands, OwnerCommands, commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db = Database(self)
-        self.active_tasks = {}
+        self.job_runner: asyncio.Task | None = None
+        self._job_wakeup = asyncio.Event()
+        self._job_failures: dict[int, int] = {}
 
     def format_help_for_context(self, ctx: commands.Context) -> str:
         """
@@ -67,55 +75,112 @@ class EasterHunt(UserCommands, OwnerCommands, commands.Cog):
 
     async def cog_load(self):
         await self.db.initialize()
-        current_time = time.time()
 
-        async with self.db.conn.cursor() as cursor:
+        async with self.db.transaction(), self.db.conn.cursor() as cursor:
             await cursor.execute("UPDATE users SET active_hunt = 0 WHERE active_hunt = 1")
-            await self.db.conn.commit()
-
-        stale_users = await self.db.get_stale_active_users()
-        for user_id, last_work in stale_users:
-            user = self.bot.get_user(user_id)
-            if not user:
-                await self.db.set_user_field(user_id, "active_work", False)
-                await self.db.set_user_field(user_id, "last_work", 0)
-                await self.db.set_user_field(user_id, "active_job_type", None)
-                continue
-            if last_work <= current_time:
-                job_type = await self.db.get_user_field(user_id, "active_job_type")
-                await self.resume_job(user, 0, job_type)
-            else:
-                remaining_time = last_work - current_time
-                job_type = await self.db.get_user_field(user_id, "active_job_type")
-                self.active_tasks[user_id] = self.bot.loop.create_task(
-                    self.resume_job(user, remaining_time, job_type)
-                )
+
+        await self.db.recover_jobs()
+        self.job_runner = self.bot.loop.create_task(self._run_scheduled_jobs())
 
     async def cog_unload(self):
-        for user_id, task in list(self.active_tasks.items()):
-            task.cancel()
-            user = self.bot.get_user(user_id)
-            if user:
-                await self.db.set_user_field(user_id, "active_work", False)
-                await self.db.set_user_field(user_id, "last_work", 0)
-                await self.db.set_user_field(user_id, "active_job_type", None)
-        self.active_tasks.clear()
+        # Scheduled shifts stay in the database and are finished after the next load.
+        if self.job_runner is not None:
+            self.job_runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.job_runner
         await self.db.close()
 
-    async def resume_job(self, user, remaining_time, job_type):
+    def wake_job_runner(self) -> None:
+        self._job_wakeup.set()
+
+    async def _run_scheduled_jobs(self) -> None:
+        """Sleep until the next shift ends, then finish every due shift in batches."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            try:
+                await self._run_job_batch()
+            except Exception:
+                # Keep the runner alive through database errors, or every shift stays stuck.
+                log.exception("Scheduled job runner failed, retrying shortly")
+                await asyncio.sleep(JOB_RETRY_DELAY)
+
+    async def _run_job_batch(self) -> None:
+        """Wait for the next due shift, or finish up to JOB_BATCH_SIZE shifts that are due."""
+        self._job_wakeup.clear()
+        now = time.time()
+        due_jobs = await self.db.get_due_jobs(now, JOB_BATCH_SIZE)
+        if not due_jobs:
+            next_due = await self.db.get_next_job_due()
+            timeout = next_due - now if next_due is not None else None
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._job_wakeup.wait(), timeout=timeout)
+            return
+        results = await asyncio.gather(
+            *(self._finish_job(*job) for job in due_jobs), return_exceptions=True
+        )
+        for (user_id, job_type, *_), result in zip(due_jobs, results, strict=True):
+            if isinstance(result, Exception):
+                await self._retry_job(user_id, job_type, result)
+            else:
+                self._job_failures.pop(user_id, None)
+
+    async def _retry_job(self, user_id: int, job_type: str, error: Exception) -> None:
+        """Push a failed shift back, or drop it once it has failed JOB_MAX_ATTEMPTS times."""
+        attempts = self._job_failures.get(user_id, 0) + 1
+        log.error(
+            f"Failed to finish the {job_type} shift of {user_id} (attempt {attempts})",
+            exc_info=error,
+        )
+        try:
+            if attempts < JOB_MAX_ATTEMPTS:
+                self._job_failures[user_id] = attempts
+                await self.db.postpone_job(user_id, time.time() + JOB_RETRY_DELAY * attempts)
+                return
+            self._job_failures.pop(user_id, None)
+            log.error(f"Giving up on the {job_type} shift of {user_id}")
+            async with self.db.transaction():
+                await self.db.delete_job(user_id)
+                await self.db.update_user(
+                    user_id, active_work=False, last_work=0, active_job_type=None
+                )
+        except Exception:
+            # The database itself is failing; pause the runner instead of spinning on it.
+            log.exception(f"Could not reschedule the {job_type} shift of {user_id}")
+            await asyncio.sleep(JOB_RETRY_DELAY)
+
+    async def _finish_job(
+        self, user_id: int, job_type: str, guild_id: int | None, channel_id: int | None
+    ) -> None:
+        user = self.bot.get_user(user_id)
+        guild = self.bot.get_guild(guild_id) if guild_id is not None else None
+        result_message = None
+        try:
+            async with self.db.transaction():
+                if not await self.db.delete_job(user_id):
+                    return
+                if user is not None:
+                    result_message = await self._execute_job_outcome(user_id, job_type, guild)
+                await self.db.update_user(
+                    user_id, active_work=False, last_work=0, active_job_type=None
+                )
+        except Exception:
+            log.exception(f"Unexpected error finishing the {job_type} shift of {user_id}")
+            async with self.db.transaction():
+                await self.db.delete_job(user_id)
+                await self.db.update_user(
+                    user_id, active_work=False, last_work=0, active_job_type=None
+                )
+            result_message = "something went wrong during your shift! It has been cancelled."
+
+        if user is None:
+            return
+        channel = self.bot.get_channel(channel_id) if channel_id is not None else None
         try:
-            if remaining_time > 0:
-                await asyncio.sleep(remaining_time)
-            result_message = await self._execute_job_outcome(user.id, job_type, guild=None)
-            with contextlib.suppress(discord.HTTPException):
+            if channel is not None:
+                await channel.send(f"{user.mention} {result_message}")
+            else:
                 await user.send(
-                    f"🐰 Your shift as a **{job_type.replace('_', ' ').title()}** finished while the bot was restarting!\n{result_message}"
+                    f"🐰 Your shift as a **{job_type.replace('_', ' ').title()}** finished!\n{result_message}"
                 )
-        except asyncio.CancelledError:
-            pass
-        finally:
-            await self.db.set_user_field(user.id, "active_work", False)
-            await self.db.set_user_field(user.id, "last_work", 0)
-            await self.db.set_user_field(user.id, "active_job_type", None)
-            if user.id in self.active_tasks:
-                del self.active_tasks[user.id]
+        except discord.HTTPException as e:
+            log.error(f"Failed to send job result message for {user}: {e}")
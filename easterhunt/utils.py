@@ -27,9 +27,9 @@ import random
 import discord
 
 
-async def check_hunt_cooldown(db, user_id: int, current_time: float) -> tuple[bool, str | None]:
+def check_hunt_cooldown(row: dict, current_time: float) -> tuple[bool, str | None]:
     """Check if the user can hunt again, returning (can_hunt, message)."""
-    last_hunt = await db.get_user_field(user_id, "last_hunt")
+    last_hunt = row["last_hunt"]
     cooldown_remaining = 300 - (current_time - last_hunt)
     if cooldown_remaining > 0:
         cooldown_end = int(current_time + cooldown_remaining)
@@ -37,26 +37,26 @@ async def check_hunt_cooldown(db, user_id: int, current_time: float) -> tuple[bo
     return True, None
 
 
-async def update_hunt_streak(db, user_id: int, current_time: float) -> int:
+async def update_hunt_streak(db, row: dict, current_time: float) -> int:
     """Update and return the user's hunt streak."""
-    last_hunt_time = await db.get_user_field(user_id, "last_hunt_time")
-    current_streak = await db.get_user_field(user_id, "hunt_streak")
+    last_hunt_time = row["last_hunt_time"]
+    current_streak = row["hunt_streak"]
 
     if last_hunt_time and (current_time - last_hunt_time) <= 900:
         new_streak = current_streak + 1
     else:
         new_streak = 1
 
-    await db.set_user_field(user_id, "hunt_streak", new_streak)
+    await db.update_user(row["user_id"], hunt_streak=new_streak)
     return new_streak
 
 
-async def calculate_hunt_probabilities(
-    db, user_id: int, current_streak: int
+def calculate_hunt_probabilities(
+    row: dict, current_streak: int
 ) -> tuple[dict[str, int], dict[str, int], bool, bool]:
     """Calculate adjusted probabilities with pity and streak bonuses."""
-    pity_counters = await db.get_pity_counters(user_id)
-    eggs = await db.get_eggs(user_id)
+    pity_counters = row["pity_counters"]
+    eggs = row["eggs"]
     for egg_type in ["silver", "gold", "shiny", "legendary", "mythical"]:
         pity_counters[egg_type] = pity_counters.get(egg_type, 0) + 1
 
@@ -109,7 +109,7 @@ async def calculate_hunt_probabilities(
 
 async def process_hunt_outcome(
     db,
-    user_id: int,
+    row: dict,
     result: str,
     pity_counters: dict[str, int],
     can_roll_legendary: bool,
@@ -141,12 +141,10 @@ async def process_hunt_outcome(
         pass
     elif result == "common":
         eggs_found = random.randint(3, 10)
-        current = await db.get_egg_count(user_id, "common")
-        await db.set_egg_count(user_id, "common", current + eggs_found)
+        await db.add_eggs(row["user_id"], {"common": eggs_found})
         description = description.format(eggs_found=eggs_found)
     else:
-        current = await db.get_egg_count(user_id, result)
-        await db.set_egg_count(user_id, result, current + 1)
+        await db.add_eggs(row["user_id"], {result: 1})
         reset_types = {
             "silver": ["silver"],
             "gold": ["silver", "gold"],
@@ -157,7 +155,7 @@ async def process_hunt_outcome(
         for t in reset_types:
             pity_counters[t] = 0
 
-    await db.set_pity_counters(user_id, pity_counters)
+    await db.set_pity_counters(row["user_id"], pity_counters)
 
     embed = discord.Embed(title="Hunt Result", color=color, description=description)
     if image_url:
@@ -48,6 +48,8 @@ log = logging.getLogger("red.maxcogs.github")
 COLOR = 0x7289DA
 TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 EMBED_DESC_LIMIT = 4000
+# How many feeds are downloaded at the same time during a check.
+FETCH_CONCURRENCY = 10
 
 # Regular expressions
 TOKEN_REGEX: re.Pattern = re.compile(r"token=(.*)")
@@ -185,7 +187,8 @@ class GitHub(commands.Cog):
         except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
             log.debug("HTTP error fetching %s: %s", url, exc)
             return False
-        return feedparser.parse(html)
+        # Parsing a large feed takes a while; keep it off the event loop.
+        return await asyncio.to_thread(feedparser.parse, html)
 
     @staticmethod
     def new_entries(entries, last_time):
@@ -749,8 +752,31 @@ class GitHub(commands.Cog):
         for embed in embeds:
             await ctx.send(embed=embed)
 
+    async def _fetch_feeds(self, urls: list[str]) -> dict:
+        """Fetch and parse each URL once, at most FETCH_CONCURRENCY at a time.
+
+        Maps each URL to ``(parsed, fetched_at)``, or ``(False, None)`` if it failed.
+        """
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def fetch(url: str):
+            async with semaphore:
+                fetched_at = datetime.now(tz=timezone.utc)
+                return await self._fetch(url, [200]), fetched_at
+
+        results = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+        feeds = {}
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, Exception):
+                log.error("Unexpected error fetching %s.", url, exc_info=result)
+                result = (False, None)
+            feeds[url] = result
+        return feeds
+
     async def _do_rss_check(self, guild_to_check: int | None = None) -> None:
-        # Loop through each guild
+        # Collect every subscription first, so each feed is fetched once per check
+        # however many members or guilds follow it.
+        subscriptions = []
         for guild_id, guild_config in (await self.config.all_guilds()).items():
             # Check for single guild
             if guild_to_check and guild_id != guild_to_check:
@@ -778,63 +804,80 @@ class GitHub(commands.Cog):
                 for name, feed in member_data["feeds"].items():
                     try:
                         url = self._url_from_config(feed)
-
-                        # Fetch & parse feed
-                        if not (parsed := await self._fetch(url, [200])):
-                            continue
-
-                        # Find new entries
-                        new_entries, new_time = self.new_entries(parsed.entries, feed["time"])
-
-                        # Create feed embed
-                        if e := self._commit_embeds(
-                            entries=new_entries,
-                            feed_link=parsed.feed.link,
-                            color=guild_config["color"],
-                            timestamp=guild_config["timestamp"],
-                            short=guild_config["short"],
-                        ):
-                            # Get channel (guild vs feed override)
-                            ch = channel
-                            if feed["channel"] and not (
-                                (ch := guild.get_channel(feed["channel"]))
-                                and ch.permissions_for(guild.me).send_messages
-                                and ch.permissions_for(guild.me).embed_links
-                            ):
-                                ch = None
-
-                            # Send feed embed
-                            if ch:
-                                await ch.send(embed=e)
-
-                            # Set time to feed config
-                            async with self.config.member_from_ids(
-                                guild_id, member_id
-                            ).feeds() as member_feeds:
-                                member_feeds[name]["time"] = new_time.timestamp()
-
-                    except discord.Forbidden:
-                        log.warning(
-                            "Missing permissions for feed '%s' (guild %s, member %s).",
-                            name,
-                            guild_id,
-                            member_id,
-                        )
-                    except discord.HTTPException as exc:
-                        log.error(
-                            "HTTP error posting feed '%s' (guild %s, member %s): %s",
-                            name,
-                            guild_id,
-                            member_id,
-                            exc,
-                        )
                     except Exception:
                         log.exception(
-                            "Unexpected error processing feed '%s' (guild %s, member %s).",
+                            "Invalid config for feed '%s' (guild %s, member %s).",
                             name,
                             guild_id,
                             member_id,
                         )
+                        continue
+                    subscriptions.append(
+                        (guild, guild_config, channel, member_id, name, feed, url)
+                    )
+
+        parsed_feeds = await self._fetch_feeds(list({sub[-1] for sub in subscriptions}))
+
+        for guild, guild_config, channel, member_id, name, feed, url in subscriptions:
+            parsed, fetched_at = parsed_feeds[url]
+            if not parsed:
+                continue
+            guild_id = guild.id
+            try:
+                # Find new entries. The stored time is when the feed was downloaded, not
+                # now: commits pushed since then are not in it and must count as new later.
+                new_entries, _ = self.new_entries(parsed.entries, feed["time"])
+                new_time = fetched_at
+
+                # Create feed embed
+                if e := self._commit_embeds(
+                    entries=new_entries,
+                    feed_link=parsed.feed.link,
+                    color=guild_config["color"],
+                    timestamp=guild_config["timestamp"],
+                    short=guild_config["short"],
+                ):
+                    # Get channel (guild vs feed override)
+                    ch = channel
+                    if feed["channel"] and not (
+                        (ch := guild.get_channel(feed["channel"]))
+                        and ch.permissions_for(guild.me).send_messages
+                        and ch.permissions_for(guild.me).embed_links
+                    ):
+                        ch = None
+
+                    # Send feed embed
+                    if ch:
+                        await ch.send(embed=e)
+
+                    # Set time to feed config
+                    async with self.config.member_from_ids(
+                        guild_id, member_id
+                    ).feeds() as member_feeds:
+                        member_feeds[name]["time"] = new_time.timestamp()
+
+            except discord.Forbidden:
+                log.warning(
+                    "Missing permissions for feed '%s' (guild %s, member %s).",
+                    name,
+                    guild_id,
+                    member_id,
+                )
+            except discord.HTTPException as exc:
+                log.error(
+                    "HTTP error posting feed '%s' (guild %s, member %s): %s",
+                    name,
+                    guild_id,
+                    member_id,
+                    exc,
+                )
+            except Exception:
+                log.exception(
+                    "Unexpected error processing feed '%s' (guild %s, member %s).",
+                    name,
+                    guild_id,
+                    member_id,
+                )
 
     @tasks.loop(minutes=3)
     async def _github_rss(self):
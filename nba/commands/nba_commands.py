@@ -98,6 +98,7 @@ class NBACommands:
             "role_id": team_channels.get(team, {}).get("role_id"),
         }
         await self.config.guild(ctx.guild).team_channels.set(team_channels)
+        self.update_team_subscriptions(ctx.guild.id, team_channels)
         await ctx.send(
             f"Set **{team}** updates to {channel.mention}.",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -126,6 +127,7 @@ class NBACommands:
             )
         del team_channels[team]
         await self.config.guild(ctx.guild).team_channels.set(team_channels)
+        self.update_team_subscriptions(ctx.guild.id, team_channels)
         await ctx.send(
             f"Removed **{team}** from NBA updates.",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -136,6 +138,7 @@ class NBACommands:
     async def nbaset_reset(self, ctx: commands.Context):
         """Reset all NBA update settings for this server."""
         await self.config.guild(ctx.guild).team_channels.set({})
+        self.update_team_subscriptions(ctx.guild.id, {})
         await ctx.send(
             "Cleared all team channel settings.",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -179,6 +182,7 @@ class NBACommands:
             )
         team_channels[team]["role_id"] = role.id
         await self.config.guild(ctx.guild).team_channels.set(team_channels)
+        self.update_team_subscriptions(ctx.guild.id, team_channels)
         await ctx.send(
             f"Pre-game ping role for **{team}** set to {role.mention}.",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -206,6 +210,9 @@ class NBACommands:
                 reference=ctx.message.to_reference(fail_if_not_exists=False),
             )
         await self.config.guild(ctx.guild).set_raw("team_channels", team, "role_id", value=None)
+        self.update_team_subscriptions(
+            ctx.guild.id, await self.config.guild(ctx.guild).team_channels()
+        )
         await ctx.send(
             f"Pre-game ping role for **{team}** removed.",
             reference=ctx.message.to_reference(fail_if_not_exists=False),
@@ -313,6 +320,27 @@ class NBACommands:
             f"Cache now has **{len(team_emojis)}** emojis loaded."
         )
 
+    @nbaset.command(name="delivery")
+    @commands.is_owner()
+    async def nbaset_delivery(self, ctx: commands.Context):
+        """Show the queue depth and send latency of game update deliveries."""
+        delivery = self.delivery
+        latencies = sorted(delivery.latencies)
+        if latencies:
+            average = sum(latencies) / len(latencies)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            latency = f"avg **{average:.2f}s** | p95 **{p95:.2f}s** | max **{latencies[-1]:.2f}s**"
+        else:
+            latency = "no messages sent yet"
+        await ctx.send(
+            f"Queue depth: **{delivery.depth}** ({delivery.worker_count} workers)\n"
+            f"Sent: **{delivery.sent}** | Failed: **{delivery.failed}** | "
+            f"Dropped: **{delivery.dropped}**\n"
+            f"Latency (last {len(latencies)}): {latency}",
+            reference=ctx.message.to_reference(fail_if_not_exists=False),
+            mention_author=False,
+        )
+
     @nbaset.command(name="settings")
     @commands.bot_has_permissions(embed_links=True)
     async def nbaset_settings(self, ctx: commands.Context):
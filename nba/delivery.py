@@ -0,0 +1,115 @@
+"""
+MIT License
+
+Copyright (c) 2022-present ltzmax
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Any
+
+import discord
+from red_commons.logging import getLogger
+
+
+log = getLogger("red.maxcogs.nba.delivery")
+
+SEND_WORKERS = 4
+SEND_QUEUE_SIZE = 1000
+LATENCY_SAMPLES = 200
+
+
+class Delivery:
+    """Send queued notifications from a small pool of workers.
+
+    Producers never wait on Discord: `enqueue` drops the message when the queue is full.
+    Each channel has its own queue and at most one worker serves a channel at a time,
+    taking one message before handing the channel back. A rate limited channel therefore
+    only holds up its own messages while the other workers keep delivering.
+    """
+
+    def __init__(self, workers: int = SEND_WORKERS, maxsize: int = SEND_QUEUE_SIZE):
+        self.worker_count = workers
+        self.maxsize = maxsize
+        # channel_id -> messages waiting for that channel, oldest first.
+        self._pending: dict[int, deque[tuple]] = {}
+        # Channels with pending messages that no worker is serving, in turn order.
+        self._ready: asyncio.Queue[int] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._depth = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        # Seconds from enqueue until Discord accepted the message, most recent last.
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def start(self) -> None:
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def enqueue(self, channel: discord.abc.Messageable, description: str, **payload: Any) -> bool:
+        """Queue ``channel.send(**payload)``; ``description`` is used in log messages."""
+        if self._depth >= self.maxsize:
+            self.dropped += 1
+            log.warning("Delivery queue full, dropped %s for channel %s", description, channel.id)
+            return False
+        pending = self._pending.get(channel.id)
+        if pending is None:
+            # The channel was idle, so it has to be handed to a worker.
+            pending = self._pending[channel.id] = deque()
+            self._ready.put_nowait(channel.id)
+        pending.append((monotonic(), channel, description, payload))
+        self._depth += 1
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            channel_id = await self._ready.get()
+            pending = self._pending[channel_id]
+            queued_at, channel, description, payload = pending.popleft()
+            self._depth -= 1
+            try:
+                await channel.send(**payload)
+            except discord.HTTPException as e:
+                self.failed += 1
+                log.error("Failed to send %s in channel %s: %s", description, channel.id, e)
+            except Exception:
+                self.failed += 1
+                log.exception("Unexpected error sending %s in channel %s", description, channel.id)
+            else:
+                self.sent += 1
+                self.latencies.append(monotonic() - queued_at)
+            finally:
+                # Back of the line, so busy channels take turns with everyone else.
+                if pending:
+                    self._ready.put_nowait(channel_id)
+                else:
+                    del self._pending[channel_id]
@@ -23,12 +23,15 @@ SOFTWARE.
 """
 
 import asyncio
-import sqlite3
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from time import time
 from typing import Any, Final
 
 import aiohttp
+import aiosqlite
 import discord
 import orjson
 from discord.ext import tasks
@@ -41,18 +44,29 @@ from .converter import (
     ESPN_NBA_NEWS,
     ESPN_NBA_STANDINGS,
     NBA_CDN_HEADERS,
+    PLAYBYPLAY,
     SCHEDULE_URL,
     TEAM_EMOJI_NAMES,
     TEAM_NAME_TO_API,
     TODAY_SCOREBOARD,
     team_emojis,
 )
+from .delivery import Delivery
 from .formatters import build_pregame_embed, build_score_update_embed
-from .view import PlayByPlay, PreGameView
+from .view import PLAY_BY_PLAY_ACTIONS, PlayByPlay, PreGameView
 
 
 log = getLogger("red.maxcogs.nba")
 
+# Poll the scoreboard this often while games are live or about to start.
+LIVE_POLL_INTERVAL: Final[int] = 15
+# Start fast polling this long before tip-off, ahead of the ~30 minute pregame notification.
+PREGAME_LEAD: Final[int] = 35 * 60
+# Longest sleep between checks, so schedule changes and the daily reset are still picked up.
+MAX_IDLE_INTERVAL: Final[int] = 60 * 60
+# How long a game's play-by-play is shared between button clicks before it is re-fetched.
+PLAY_BY_PLAY_TTL: Final[int] = 10
+
 # TODO to myself.
 # - Add a pre embed when game(s) are done playing for the day,
 # with a recap of the day's results (if we can get that data) and a lookahead at the next day's schedule.
@@ -83,23 +97,42 @@ class NBA(NBACommands, commands.Cog):
         }
         self.config.register_guild(**default_guild)
         self.session = aiohttp.ClientSession(headers=NBA_CDN_HEADERS)
+        # Score and pre-game messages are handed to this sender so polling never waits on Discord.
+        self.delivery = Delivery()
         self.data_path = cog_data_path(self)
         self.data_path.mkdir(parents=True, exist_ok=True)
         self.db_path = self.data_path / "game_scores.db"
-        self.setup_database()
+        self.db: aiosqlite.Connection | None = None
+        # In-memory mirror of the `game_scores` table, keyed by game id. Like the table,
+        # it is emptied by the first daily reset, which also runs on load.
+        self.game_scores: dict[str, tuple[str, str, int, int, str, int]] = {}
+        # API team name -> {guild_id: (channel_id, role_id)} for every configured team channel.
+        self.team_subscriptions: defaultdict[str, dict[int, tuple]] = defaultdict(dict)
         self.finalized_games: set[str] = set()
         self.notified_pregames: set[str] = set()
-        self._load_finalized_from_db()
         self.last_reset_date = None
-        self.schedule_cache = None
+        # (tip-off timestamp, game) for the season, sorted by tip-off, plus the bare timestamps.
+        self.schedule_games: list[tuple[int, dict]] = []
+        self.schedule_times: list[int] = []
         self.schedule_time = 0
+        self.games_live = False
+        # url -> (ETag, Last-Modified) of the last full response, for conditional requests.
+        self._validators: dict[str, tuple[str | None, str | None]] = {}
+        # game_id -> (fetched at, last actions), and the in-flight fetch per game.
+        self._play_by_play_cache: dict[str, tuple[float, list[dict]]] = {}
+        self._play_by_play_requests: dict[str, asyncio.Task] = {}
         self.scoreboard_cache = None
         self.scoreboard_time = 0
         self.cache_ttl = 60
-        self.periodic_check.start()
 
     async def cog_load(self) -> None:
         await self._migrate_legacy_config()
+        await self._build_team_subscriptions()
+        self.db = await aiosqlite.connect(self.db_path)
+        await self.setup_database()
+        await self._load_finalized_from_db()
+        self.delivery.start()
+        self.periodic_check.start()
 
     # to be removed in two months.
     async def _migrate_legacy_config(self) -> None:
@@ -134,6 +167,37 @@ class NBA(NBACommands, commands.Cog):
         if migrated:
             log.info("Migration complete: %d guild(s) migrated to team_channels.", migrated)
 
+    async def _build_team_subscriptions(self) -> None:
+        self.team_subscriptions.clear()
+        for guild_id, data in (await self.config.all_guilds()).items():
+            self.update_team_subscriptions(guild_id, data.get("team_channels") or {})
+
+    def update_team_subscriptions(self, guild_id: int, team_channels: dict[str, dict]) -> None:
+        """Replace a guild's entries in the subscription index with its current team channels."""
+        for subscribers in self.team_subscriptions.values():
+            subscribers.pop(guild_id, None)
+        for team_key, entry in team_channels.items():
+            api_name = TEAM_NAME_TO_API.get(team_key.lower())
+            if api_name and entry.get("channel_id"):
+                self.team_subscriptions[api_name][guild_id] = (
+                    entry["channel_id"],
+                    entry.get("role_id"),
+                )
+
+    def get_game_subscribers(
+        self, home_team: str, away_team: str
+    ) -> list[tuple[int, int, int | None]]:
+        """Return ``(guild_id, channel_id, role_id)`` for each guild following either team.
+
+        When a guild follows both teams, only the home team's channel is returned
+        to avoid double posting.
+        """
+        home = self.team_subscriptions.get(home_team, {})
+        away = self.team_subscriptions.get(away_team, {})
+        return [(guild_id, *entry) for guild_id, entry in home.items()] + [
+            (guild_id, *entry) for guild_id, entry in away.items() if guild_id not in home
+        ]
+
     def format_help_for_context(self, ctx: commands.Context) -> str:
         """Thanks Sinbad!"""
         pre_processed = super().format_help_for_context(ctx)
@@ -143,48 +207,43 @@ class NBA(NBACommands, commands.Cog):
         """Nothing to delete."""
         return
 
-    def setup_database(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS game_scores (
-                    game_id TEXT PRIMARY KEY,
-                    home_team TEXT,
-                    away_team TEXT,
-                    home_score INTEGER,
-                    away_score INTEGER,
-                    game_clock TEXT,
-                    period INTEGER
-                )
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS finalized_games (
-                    game_id TEXT PRIMARY KEY,
-                    finalized_date TEXT
-                )
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS notified_pregames (
-                    game_id TEXT PRIMARY KEY,
-                    notified_date TEXT
-                )
-            """)
-            conn.commit()
-
-    def _load_finalized_from_db(self):
-        today = datetime.now(tz=timezone.utc).date().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT game_id FROM finalized_games WHERE finalized_date = ?", (today,)
+    async def setup_database(self):
+        await self.db.execute("PRAGMA journal_mode = WAL")
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS game_scores (
+                game_id TEXT PRIMARY KEY,
+                home_team TEXT,
+                away_team TEXT,
+                home_score INTEGER,
+                away_score INTEGER,
+                game_clock TEXT,
+                period INTEGER
+            )
+        """)
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS finalized_games (
+                game_id TEXT PRIMARY KEY,
+                finalized_date TEXT
             )
-            for row in cursor.fetchall():
-                self.finalized_games.add(row[0])
-            cursor.execute(
-                "SELECT game_id FROM notified_pregames WHERE notified_date = ?", (today,)
+        """)
+        await self.db.execute("""
+            CREATE TABLE IF NOT EXISTS notified_pregames (
+                game_id TEXT PRIMARY KEY,
+                notified_date TEXT
             )
-            for row in cursor.fetchall():
-                self.notified_pregames.add(row[0])
+        """)
+        await self.db.commit()
+
+    async def _load_finalized_from_db(self):
+        today = datetime.now(tz=timezone.utc).date().isoformat()
+        async with self.db.execute(
+            "SELECT game_id FROM finalized_games WHERE finalized_date = ?", (today,)
+        ) as cursor:
+            self.finalized_games.update(row[0] for row in await cursor.fetchall())
+        async with self.db.execute(
+            "SELECT game_id FROM notified_pregames WHERE notified_date = ?", (today,)
+        ) as cursor:
+            self.notified_pregames.update(row[0] for row in await cursor.fetchall())
         log.info(
             "Loaded %d finalized and %d pre-game notified games from DB for %s",
             len(self.finalized_games),
@@ -192,7 +251,7 @@ class NBA(NBACommands, commands.Cog):
             today,
         )
 
-    def reset_finalized_games_if_needed(self):
+    async def reset_finalized_games_if_needed(self):
         """Reset finalized_games if the date has changed and clean up old DB rows."""
         current_date = datetime.now(tz=timezone.utc).date()
         if self.last_reset_date is None or self.last_reset_date != current_date:
@@ -200,40 +259,99 @@ class NBA(NBACommands, commands.Cog):
             self.finalized_games.clear()
             self.last_reset_date = current_date
             yesterday = current_date.isoformat()
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM finalized_games WHERE finalized_date != ?", (yesterday,)
-                )
-                cursor.execute("DELETE FROM game_scores")
-                cursor.execute(
-                    "DELETE FROM notified_pregames WHERE notified_date != ?", (yesterday,)
-                )
-                conn.commit()
+            await self.db.execute(
+                "DELETE FROM finalized_games WHERE finalized_date != ?", (yesterday,)
+            )
+            await self.db.execute("DELETE FROM game_scores")
+            await self.db.execute(
+                "DELETE FROM notified_pregames WHERE notified_date != ?", (yesterday,)
+            )
+            await self.db.commit()
+            self.game_scores.clear()
             self.notified_pregames.clear()
             log.info("Cleaned up old game data from DB.")
 
-    @tasks.loop(seconds=15)
+    async def _save_game_state(
+        self, score_rows: list[tuple[str, str, str, int, int, str, int]], finalized: list[str]
+    ) -> None:
+        """Write one tick's changed score rows and newly finalized games in one transaction."""
+        if not score_rows and not finalized:
+            return
+        today = datetime.now(tz=timezone.utc).date().isoformat()
+        try:
+            await self.db.executemany(
+                """
+                INSERT INTO game_scores
+                (game_id, home_team, away_team, home_score, away_score, game_clock, period)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (game_id) DO UPDATE SET
+                    home_team = excluded.home_team,
+                    away_team = excluded.away_team,
+                    home_score = excluded.home_score,
+                    away_score = excluded.away_score,
+                    game_clock = excluded.game_clock,
+                    period = excluded.period
+                """,
+                score_rows,
+            )
+            await self.db.executemany(
+                "DELETE FROM game_scores WHERE game_id = ?", [(game_id,) for game_id in finalized]
+            )
+            await self.db.executemany(
+                "INSERT OR IGNORE INTO finalized_games (game_id, finalized_date) VALUES (?, ?)",
+                [(game_id, today) for game_id in finalized],
+            )
+            await self.db.commit()
+        except aiosqlite.Error as e:
+            await self.db.rollback()
+            log.error("Failed to save game scores: %s", e)
+
+    @tasks.loop(seconds=LIVE_POLL_INTERVAL)
     async def periodic_check(self):
-        self.reset_finalized_games_if_needed()
         try:
-            async with self.session.get(TODAY_SCOREBOARD) as response:
-                if response.status != 200:
-                    log.warning("Scoreboard returned status %s", response.status)
-                    return
-                data = await response.read()
-        except aiohttp.ClientError as e:
-            log.error("Network error fetching scoreboard: %s", e)
+            await self._check_games()
+        finally:
+            self.periodic_check.change_interval(seconds=self._next_check_interval())
+
+    def _next_check_interval(self) -> float:
+        """Return how long to sleep before the next check, based on live games and the schedule.
+
+        Polls every LIVE_POLL_INTERVAL while a game is live or one tips off within
+        PREGAME_LEAD (or did so that recently), and otherwise sleeps until the next game's
+        pregame lead starts, for at most MAX_IDLE_INTERVAL.
+        """
+        if self.games_live:
+            return LIVE_POLL_INTERVAL
+        if not self.schedule_times:
+            # The schedule has not loaded yet; retry once it may be fetched again.
+            return self.cache_ttl
+        now_ts = datetime.now(tz=timezone.utc).timestamp()
+        index = bisect_left(self.schedule_times, now_ts - PREGAME_LEAD)
+        if index == len(self.schedule_times):
+            return MAX_IDLE_INTERVAL
+        until_lead = self.schedule_times[index] - PREGAME_LEAD - now_ts
+        return min(max(until_lead, LIVE_POLL_INTERVAL), MAX_IDLE_INTERVAL)
+
+    async def _check_games(self):
+        await self.reset_finalized_games_if_needed()
+        data = await self.fetch_data(TODAY_SCOREBOARD, conditional=True)
+        if data is None:
+            # Not modified since the last tick, or unavailable: no scores to diff.
+            await self._check_pregame_notifications()
             return
 
         try:
             games = orjson.loads(data).get("scoreboard", {}).get("games", [])
         except Exception as e:
             log.error("Failed to parse scoreboard JSON: %s", e)
+            self._validators.pop(TODAY_SCOREBOARD, None)
             return
+        # gameStatus is 1 before tip-off, 2 while live and 3 once final.
+        self.games_live = any(game.get("gameStatus") == 2 for game in games if game)
 
-        all_guild_configs = await self.config.all_guilds()
-
+        score_rows = []
+        finalized = []
+        score_changes = []
         for game in games:
             if not game:
                 continue
@@ -255,52 +373,20 @@ class NBA(NBACommands, commands.Cog):
                 continue
 
             if game_status == "Final":
-                today = datetime.now(tz=timezone.utc).date().isoformat()
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM game_scores WHERE game_id = ?", (game_id,))
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO finalized_games (game_id, finalized_date) VALUES (?, ?)",
-                        (game_id, today),
-                    )
-                    conn.commit()
+                finalized.append(game_id)
                 self.finalized_games.add(game_id)
+                self.game_scores.pop(game_id, None)
                 continue
 
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT home_score, away_score FROM game_scores WHERE game_id = ?",
-                    (game_id,),
-                )
-                result = cursor.fetchone()
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO game_scores
-                    (game_id, home_team, away_team, home_score, away_score, game_clock, period)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        game_id,
-                        home_team_name,
-                        away_team_name,
-                        home_score,
-                        away_score,
-                        game_clock,
-                        period,
-                    ),
-                )
-                conn.commit()
-
-            previous_home_score = result[0] if result else None
-            previous_away_score = result[1] if result else None
-            scores_changed = (
-                previous_home_score is not None
-                and previous_away_score is not None
-                and (home_score != previous_home_score or away_score != previous_away_score)
-            )
+            row = (home_team_name, away_team_name, home_score, away_score, game_clock, period)
+            previous = self.game_scores.get(game_id)
+            if row == previous:
+                continue
+            self.game_scores[game_id] = row
+            score_rows.append((game_id, *row))
 
-            if not scores_changed:
+            # The first sighting of a game only records its score.
+            if previous is None or previous[2:4] == (home_score, away_score):
                 continue
 
             log.debug(
@@ -311,96 +397,72 @@ class NBA(NBACommands, commands.Cog):
                 away_score,
                 away_team_name,
             )
-
-            # Notify all configured guilds
-            for guild_id, guild_data in all_guild_configs.items():
-                team_channels = guild_data.get("team_channels") or {}
-                if not team_channels:
-                    continue
-
-                # Resolve which team entries match this game.
-                home_entry = None
-                away_entry = None
-                for team_key, entry in team_channels.items():
-                    api_name = TEAM_NAME_TO_API.get(team_key.lower())
-                    if not api_name:
-                        continue
-                    if api_name == home_team_name:
-                        home_entry = entry
-                    elif api_name == away_team_name:
-                        away_entry = entry
-
-                # If both teams are configured, only notify via the home team's channel
-                # to avoid double posting when two tracked teams face each other.
-                if (home_entry and away_entry) or home_entry:
-                    entries_to_notify = [home_entry]
-                elif away_entry:
-                    entries_to_notify = [away_entry]
-                else:
-                    continue
-
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
-                    continue
-
-                embed = build_score_update_embed(
+            score_changes.append(
+                (
+                    game_id,
                     home_team_name,
                     away_team_name,
                     home_score,
                     away_score,
-                    period,
                     game_clock,
-                    game_id,
+                    period,
+                )
+            )
+
+        await self._save_game_state(score_rows, finalized)
+
+        for (
+            game_id,
+            home_team_name,
+            away_team_name,
+            home_score,
+            away_score,
+            game_clock,
+            period,
+        ) in score_changes:
+            subscribers = self.get_game_subscribers(home_team_name, away_team_name)
+            if not subscribers:
+                continue
+            embed = build_score_update_embed(
+                home_team_name,
+                away_team_name,
+                home_score,
+                away_score,
+                period,
+                game_clock,
+                game_id,
+            )
+            for guild_id, channel_id, _role_id in subscribers:
+                guild = self.bot.get_guild(guild_id)
+                if not guild:
+                    continue
+                channel = guild.get_channel_or_thread(channel_id)
+                if not channel:
+                    continue
+                if not (
+                    channel.permissions_for(guild.me).send_messages
+                    and channel.permissions_for(guild.me).embed_links
+                ):
+                    log.warning(
+                        "Missing permissions for game %s in guild %s channel %s",
+                        game_id,
+                        guild_id,
+                        channel_id,
+                    )
+                    continue
+                # Views hold per-message state, so every message gets its own.
+                self.delivery.enqueue(
+                    channel,
+                    f"score update for game {game_id}",
+                    embed=embed,
+                    view=PlayByPlay(self, game_id),
                 )
-                for entry in entries_to_notify:
-                    channel_id = entry.get("channel_id")
-                    if not channel_id:
-                        continue
-                    channel = guild.get_channel_or_thread(channel_id)
-                    if not channel:
-                        continue
-                    if not (
-                        channel.permissions_for(guild.me).send_messages
-                        and channel.permissions_for(guild.me).embed_links
-                    ):
-                        log.warning(
-                            "Missing permissions for game %s in guild %s channel %s",
-                            game_id,
-                            guild_id,
-                            channel_id,
-                        )
-                        continue
-                    try:
-                        await channel.send(embed=embed, view=PlayByPlay(game_id))
-                    except discord.HTTPException as e:
-                        log.error(
-                            "Failed to send score update for game %s in guild %s: %s",
-                            game_id,
-                            guild_id,
-                            e,
-                        )
 
         await self._check_pregame_notifications()
 
     async def _check_pregame_notifications(self) -> None:
         """Send a pre-game embed ~30 minutes before tip-off for configured guilds."""
-        # Reuse cached schedule data to avoid re-fetching the ~2MB file on every 15s tick.
-        if self.schedule_cache and (time() - self.schedule_time) < self.cache_ttl:
-            raw = self.schedule_cache
-        else:
-            try:
-                async with self.session.get(SCHEDULE_URL) as resp:
-                    if resp.status != 200:
-                        return
-                    raw = await resp.read()
-                self.schedule_cache = raw
-                self.schedule_time = time()
-            except Exception:
-                return
-        try:
-            schedule = orjson.loads(raw)
-        except Exception:
-            return
+        await self._refresh_schedule()
 
         now_ts = datetime.now(tz=timezone.utc).timestamp()
         # around 30 minutes before start
@@ -408,12 +470,89 @@ class NBA(NBACommands, commands.Cog):
         window_start = now_ts + (29 * 60)
         window_end = now_ts + (31 * 60)
 
-        pregame_guild_configs = await self.config.all_guilds()
+        start = bisect_left(self.schedule_times, window_start)
+        end = bisect_right(self.schedule_times, window_end)
+        for game_ts, game in self.schedule_games[start:end]:
+            game_id = game.get("gameId") or game.get("gameGuid")
+            if game_id in self.notified_pregames:
+                continue
+
+            home_team = game.get("homeTeam", {}).get("teamName", "Unknown")
+            away_team = game.get("awayTeam", {}).get("teamName", "Unknown")
+            arena = game.get("arenaName", "Unknown")
+            arena_city = game.get("arenaCity", "")
+            arena_state = game.get("arenaState", "")
+            try:
+                embed = build_pregame_embed(
+                    home_team=home_team,
+                    away_team=away_team,
+                    game_ts=game_ts,
+                    arena=arena,
+                    arena_city=arena_city,
+                    arena_state=arena_state,
+                    game_id=game_id,
+                )
+            except TypeError as e:
+                log.error("Error building pre-game embed for game %s: %s", game_id, e)
+                continue
+            today = datetime.now(tz=timezone.utc).date().isoformat()
+            await self.db.execute(
+                "INSERT OR IGNORE INTO notified_pregames (game_id, notified_date) VALUES (?, ?)",
+                (game_id, today),
+            )
+            await self.db.commit()
+            self.notified_pregames.add(game_id)
+
+            for guild_id, channel_id, role_id in self.get_game_subscribers(home_team, away_team):
+                guild = self.bot.get_guild(guild_id)
+                if not guild:
+                    continue
+                channel = guild.get_channel_or_thread(channel_id)
+                if not channel:
+                    continue
+                if not (
+                    channel.permissions_for(guild.me).send_messages
+                    and channel.permissions_for(guild.me).embed_links
+                ):
+                    continue
+                role = guild.get_role(role_id) if role_id else None
+                mention = role.mention if role else None
+                log.warning(
+                    "Sending pregame for game %s, role %s, mention %s",
+                    game_id,
+                    role_id,
+                    mention,
+                )
+                self.delivery.enqueue(
+                    channel,
+                    f"pre-game embed for {game_id}",
+                    content=mention,
+                    embed=embed,
+                    view=PreGameView(game_id),
+                    allowed_mentions=discord.AllowedMentions(roles=True),
+                )
+
+    async def _refresh_schedule(self) -> None:
+        """Re-index the schedule when it changed, checking at most once per cache TTL."""
+        # The schedule is ~2MB, so a 304 saves both the download and the parse.
+        if time() - self.schedule_time < self.cache_ttl:
+            return
+        self.schedule_time = time()
+        raw = await self.fetch_data(SCHEDULE_URL, conditional=True)
+        if raw is None:
+            return
+        try:
+            schedule = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            log.error("Failed to decode schedule: %s", e)
+            self._validators.pop(SCHEDULE_URL, None)
+            return
+
+        indexed = []
         for date in schedule.get("leagueSchedule", {}).get("gameDates", []):
             for game in date.get("games", []):
                 game_time_str = game.get("gameDateTimeUTC")
-                game_id = game.get("gameId") or game.get("gameGuid")
-                if not game_time_str or not game_id:
+                if not game_time_str or not (game.get("gameId") or game.get("gameGuid")):
                     continue
                 try:
                     game_ts = int(
@@ -423,112 +562,42 @@ class NBA(NBACommands, commands.Cog):
                     )
                 except ValueError:
                     continue
-                if not (window_start <= game_ts <= window_end):
-                    continue
-                if game_id in self.notified_pregames:
-                    continue
+                indexed.append((game_ts, game))
+        indexed.sort(key=itemgetter(0))
+        self.schedule_games = indexed
+        self.schedule_times = [game_ts for game_ts, _ in indexed]
 
-                home_team = game.get("homeTeam", {}).get("teamName", "Unknown")
-                away_team = game.get("awayTeam", {}).get("teamName", "Unknown")
-                arena = game.get("arenaName", "Unknown")
-                arena_city = game.get("arenaCity", "")
-                arena_state = game.get("arenaState", "")
-                try:
-                    embed = build_pregame_embed(
-                        home_team=home_team,
-                        away_team=away_team,
-                        game_ts=game_ts,
-                        arena=arena,
-                        arena_city=arena_city,
-                        arena_state=arena_state,
-                        game_id=game_id,
-                    )
-                except TypeError as e:
-                    log.error("Error building pre-game embed for game %s: %s", game_id, e)
-                    continue
-                today = datetime.now(tz=timezone.utc).date().isoformat()
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.execute(
-                        "INSERT OR IGNORE INTO notified_pregames (game_id, notified_date) VALUES (?, ?)",
-                        (game_id, today),
-                    )
-                    conn.commit()
-                self.notified_pregames.add(game_id)
-
-                for guild_id, guild_data in pregame_guild_configs.items():
-                    team_channels = guild_data.get("team_channels") or {}
-                    if not team_channels:
-                        continue
-
-                    # Same home-team-wins deduplication as the score update task.
-                    home_entry = None
-                    away_entry = None
-                    for team_key, entry in team_channels.items():
-                        api_name = TEAM_NAME_TO_API.get(team_key.lower())
-                        if not api_name:
-                            continue
-                        if api_name == home_team:
-                            home_entry = entry
-                        elif api_name == away_team:
-                            away_entry = entry
-
-                    if (home_entry and away_entry) or home_entry:
-                        entries_to_notify = [home_entry]
-                    elif away_entry:
-                        entries_to_notify = [away_entry]
-                    else:
-                        continue
-
-                    guild = self.bot.get_guild(guild_id)
-                    if not guild:
-                        continue
-
-                    for entry in entries_to_notify:
-                        channel_id = entry.get("channel_id")
-                        role_id = entry.get("role_id")
-                        if not channel_id:
-                            continue
-                        channel = guild.get_channel_or_thread(channel_id)
-                        if not channel:
-                            continue
-                        if not (
-                            channel.permissions_for(guild.me).send_messages
-                            and channel.permissions_for(guild.me).embed_links
-                        ):
-                            continue
-                        role = guild.get_role(role_id) if role_id else None
-                        mention = role.mention if role else None
-                        log.warning(
-                            "Sending pregame for game %s, role %s, mention %s",
-                            game_id,
-                            role_id,
-                            mention,
-                        )
-                        try:
-                            await channel.send(
-                                content=mention,
-                                embed=embed,
-                                view=PreGameView(game_id),
-                                allowed_mentions=discord.AllowedMentions(roles=True),
-                            )
-                        except discord.HTTPException as e:
-                            log.error(
-                                "Failed to send pre-game embed for %s in guild %s: %s",
-                                game_id,
-                                guild_id,
-                                e,
-                            )
-
-    async def fetch_data(self, url: str, ctx: commands.Context | None = None) -> bytes | None:
-        """Fetch data from a URL using the shared session with error handling."""
+    async def fetch_data(
+        self, url: str, ctx: commands.Context | None = None, *, conditional: bool = False
+    ) -> bytes | None:
+        """Fetch data from a URL using the shared session with error handling.
+
+        With ``conditional``, the ETag and Last-Modified of the previous response are sent
+        back, and ``None`` is returned when the server answers 304 Not Modified.
+        """
+        headers = {}
+        if conditional:
+            etag, last_modified = self._validators.get(url, (None, None))
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
         try:
-            async with self.session.get(url) as resp:
+            async with self.session.get(url, headers=headers) as resp:
+                if conditional and resp.status == 304:
+                    return None
                 if resp.status != 200:
                     log.error("Failed to fetch %s: %s", url, resp.status)
                     if ctx:
                         await ctx.send("Failed to fetch data. Try again later.")
                     return None
-                return await resp.read()
+                data = await resp.read()
+                if conditional:
+                    self._validators[url] = (
+                        resp.headers.get("ETag"),
+                        resp.headers.get("Last-Modified"),
+                    )
+                return data
         except aiohttp.ClientError as e:
             log.error("Network error fetching %s: %s", url, e)
             return None
@@ -558,6 +627,40 @@ class NBA(NBACommands, commands.Cog):
             log.error("Failed to decode scoreboard: %s", e)
             return None
 
+    async def fetch_play_by_play(self, game_id: str) -> list[dict] | None:
+        """Return the latest play-by-play actions of a game, or ``None`` if fetching failed.
+
+        Results are shared for PLAY_BY_PLAY_TTL seconds and concurrent clicks wait on the
+        same request. Only the last PLAY_BY_PLAY_ACTIONS actions are kept.
+        """
+        cached = self._play_by_play_cache.get(game_id)
+        if cached and time() - cached[0] < PLAY_BY_PLAY_TTL:
+            return cached[1]
+        task = self._play_by_play_requests.get(game_id)
+        if task is None:
+            task = asyncio.create_task(self._download_play_by_play(game_id))
+            self._play_by_play_requests[game_id] = task
+            task.add_done_callback(lambda _: self._play_by_play_requests.pop(game_id, None))
+        return await asyncio.shield(task)
+
+    async def _download_play_by_play(self, game_id: str) -> list[dict] | None:
+        data = await self.fetch_data(f"{PLAYBYPLAY}/liveData/playbyplay/playbyplay_{game_id}.json")
+        if data is None:
+            return None
+        try:
+            actions = orjson.loads(data).get("game", {}).get("actions", [])
+        except orjson.JSONDecodeError as e:
+            log.error("Failed to decode play-by-play for game %s: %s", game_id, e)
+            return None
+        now = time()
+        self._play_by_play_cache = {
+            cached_id: entry
+            for cached_id, entry in self._play_by_play_cache.items()
+            if now - entry[0] < PLAY_BY_PLAY_TTL
+        }
+        self._play_by_play_cache[game_id] = (now, actions[-PLAY_BY_PLAY_ACTIONS:])
+        return self._play_by_play_cache[game_id][1]
+
     async def fetch_news(self, ctx: commands.Context) -> list[dict] | None:
         """Fetch and parse NBA news from ESPN JSON API."""
         data = await self.fetch_data(ESPN_NBA_NEWS, ctx)
@@ -607,5 +710,8 @@ class NBA(NBACommands, commands.Cog):
 
     async def cog_unload(self):
         self.periodic_check.cancel()
+        await self.delivery.close()
+        if self.db is not None:
+            await self.db.close()
         if self.session and not self.session.closed:
             await self.session.close()
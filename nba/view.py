@@ -24,15 +24,14 @@ SOFTWARE.
 
 import re
 
-import aiohttp
 import discord
 from red_commons.logging import getLogger
 
-from .converter import NBA_CDN_HEADERS, PLAYBYPLAY
-
 
 log = getLogger("red.maxcogs.nba.view")
 
+PLAY_BY_PLAY_ACTIONS = 9
+
 
 class PreGameView(discord.ui.View):
     """Persistent view with watch links for the pre-game notification."""
@@ -58,41 +57,28 @@ class PreGameView(discord.ui.View):
 
 
 class PlayByPlay(discord.ui.View):
-    def __init__(self, game_id):
+    def __init__(self, cog, game_id):
         super().__init__(timeout=None)
+        self.cog = cog
         self.game_id = game_id
 
     @discord.ui.button(label="View Play by Play", style=discord.ButtonStyle.blurple, emoji="🏀")
     async def view_play_by_play(self, interaction: discord.Interaction, button: discord.ui.Button):
-        url = f"{PLAYBYPLAY}/liveData/playbyplay/playbyplay_{self.game_id}.json"
-        try:
-            async with (
-                aiohttp.ClientSession(headers=NBA_CDN_HEADERS) as session,
-                session.get(url) as response,
-            ):
-                if response.status != 200:
-                    return await interaction.response.send_message(
-                        f"Failed to fetch play-by-play data (status {response.status}).",
-                        ephemeral=True,
-                    )
-                play_by_play_data = await response.json()
-        except aiohttp.ClientError as e:
-            log.error("Network error fetching play-by-play for game %s: %s", self.game_id, e)
+        actions = await self.cog.fetch_play_by_play(self.game_id)
+        if actions is None:
             return await interaction.response.send_message(
-                "Network error fetching play-by-play. Please try again.", ephemeral=True
+                "Failed to fetch play-by-play data. Please try again.", ephemeral=True
             )
-
-        actions = play_by_play_data.get("game", {}).get("actions", [])
         if not actions:
             return await interaction.response.send_message(
                 "No play-by-play data available yet.", ephemeral=True
             )
 
-        last_actions = actions[-9:]
+        last_actions = actions[-PLAY_BY_PLAY_ACTIONS:]
         embed = discord.Embed(
             title="Play by Play",
             color=0x3820F0,
-            description="Only the last 9 actions are displayed",
+            description=f"Only the last {PLAY_BY_PLAY_ACTIONS} actions are displayed",
         )
         for action in last_actions:
             embed.add_field(